@@ -0,0 +1,256 @@
+import numpy as np
+
+# Numba is optional; the NumPy fallback below keeps conversion working
+# on systems without it
+try:
+    from numba import njit, prange, types as _nb_types
+    from numba.typed import List as _NumbaList
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
+if HAS_NUMBA:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _pcm_to_planar_f32_jit(raw, channels, scale, out):
+        frames = out.shape[1]
+        for i in prange(frames):
+            for c in range(channels):
+                out[c, i] = raw[i * channels + c] * scale
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _apply_gain_jit(region, gain):
+        channels = region.shape[0]
+        n = region.shape[1]
+        for i in prange(n):
+            for c in range(channels):
+                region[c, i] *= gain
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _apply_ramp_jit(region, ramp):
+        channels = region.shape[0]
+        n = region.shape[1]
+        for i in prange(n):
+            r = ramp[i]
+            for c in range(channels):
+                region[c, i] *= r
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _planar_to_i16_jit(samples, out):
+        channels = samples.shape[0]
+        frames = samples.shape[1]
+        half = np.float32(0.5)
+        scale = np.float32(32767.0)
+        for i in prange(frames):
+            for c in range(channels):
+                v = samples[c, i] * scale
+                # Round half away from zero, matching np.rint closely
+                # enough for PCM while staying branch-cheap
+                if v >= 0.0:
+                    out[i, c] = np.int16(v + half)
+                else:
+                    out[i, c] = np.int16(v - half)
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _mix_block_jit(out, sources, volumes, start_idx):
+        channels = out.shape[0]
+        frames = out.shape[1]
+        n_tracks = len(sources)
+        for i in prange(frames):
+            j = start_idx + i
+            for c in range(channels):
+                acc = np.float32(0.0)
+                for t in range(n_tracks):
+                    src = sources[t]
+                    if j < src.shape[1]:
+                        # Mono sources feed every output channel
+                        sc = c if c < src.shape[0] else src.shape[0] - 1
+                        acc += src[sc, j] * volumes[t]
+                out[c, i] = acc
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _minmax_envelope_jit(samples, n_bins, out_min, out_max):
+        n = samples.shape[0]
+        step = n // n_bins
+        for i in prange(n_bins):
+            lo = i * step
+            hi = n if i == n_bins - 1 else lo + step
+            mn = samples[lo]
+            mx = samples[lo]
+            for j in range(lo + 1, hi):
+                v = samples[j]
+                if v < mn:
+                    mn = v
+                if v > mx:
+                    mx = v
+            out_min[i] = mn
+            out_max[i] = mx
+
+
+def pcm_to_planar_f32(raw, channels, sample_width):
+    """
+    Convert interleaved integer PCM to a planar (channels, N) float32
+    array normalized to [-1, 1].
+
+    Fuses the deinterleave, the int->float cast, and the scale into a
+    single pass over the buffer; the pass is multithreaded when numba
+    is available.
+
+    Args:
+        raw: 1-D interleaved integer sample array
+        channels: Number of audio channels
+        sample_width: Bytes per sample (1, 2, or 4)
+
+    Returns:
+        float32 ndarray with shape (channels, frames)
+    """
+    frames = raw.size // channels
+    scale = np.float32(1.0 / (1 << (8 * sample_width - 1)))
+    out = np.empty((channels, frames), dtype=np.float32)
+
+    if HAS_NUMBA:
+        _pcm_to_planar_f32_jit(raw, channels, scale, out)
+    else:
+        np.multiply(raw.reshape(-1, channels).T, scale, out=out)
+
+    return out
+
+
+def apply_gain_inplace(region, gain):
+    """
+    Multiply an edit region by a scalar gain in place.
+
+    Accepts a 1-D slice or a (channels, n) view; walks the selection in
+    one multithreaded pass when numba is available.
+    """
+    region2d = region if region.ndim > 1 else region.reshape(1, -1)
+    if HAS_NUMBA:
+        _apply_gain_jit(region2d, gain)
+    else:
+        np.multiply(region2d, gain, out=region2d)
+
+
+def apply_ramp_inplace(region, ramp):
+    """
+    Multiply an edit region by a per-sample ramp (fade curve) in place.
+
+    The (n,) ramp is applied across all channels of a 1-D slice or a
+    (channels, n) view in a single pass, parallel under numba.
+    """
+    region2d = region if region.ndim > 1 else region.reshape(1, -1)
+    if HAS_NUMBA:
+        _apply_ramp_jit(region2d, ramp)
+    else:
+        np.multiply(region2d, ramp, out=region2d)
+
+
+def planar_to_interleaved_i16(samples, out=None):
+    """
+    Quantize planar float (channels, N) samples to interleaved (N,
+    channels) int16 for export.
+
+    Fuses the scale, the round, and the transpose into one pass over the
+    buffer when numba is available; the NumPy fallback needs one float32
+    temporary. ``out`` may supply a preallocated (N, channels) int16
+    buffer so repeated exports skip the allocation.
+    """
+    if out is None:
+        out = np.empty((samples.shape[1], samples.shape[0]), dtype=np.int16)
+    if HAS_NUMBA:
+        _planar_to_i16_jit(samples, out)
+    else:
+        scaled = np.multiply(samples.T, 32767.0, dtype=np.float32)
+        np.rint(scaled, out=scaled)
+        np.copyto(out, scaled, casting='unsafe')
+    return out
+
+
+def make_source_list(arrays):
+    """
+    Pack per-track (channels, n) float32 sample views for mix_block.
+
+    Under numba this builds a typed list (required by the jitted
+    kernel); build it once per playback session, not per callback.
+    """
+    if HAS_NUMBA:
+        sources = _NumbaList.empty_list(_nb_types.float32[:, :])
+        for a in arrays:
+            sources.append(a)
+        return sources
+    return list(arrays)
+
+
+def mix_block(out, sources, volumes, start_idx):
+    """
+    Mix planar float32 track sources into ``out`` in one fused pass.
+
+    ``out`` is (channels, frames) and is fully overwritten. Sources are
+    (channels, n) arrays from make_source_list; mono sources feed every
+    output channel, reads past a source's end contribute silence, and
+    ``volumes[t]`` scales source t. Runs as a parallel numba kernel
+    when available, so the audio callback does one loop over
+    channels x frames instead of per-track slicing and accumulation.
+    """
+    if HAS_NUMBA:
+        _mix_block_jit(out, sources, volumes, start_idx)
+        return
+
+    out.fill(0.0)
+    frames = out.shape[1]
+    for t, src in enumerate(sources):
+        avail = src.shape[1] - start_idx
+        if avail <= 0:
+            continue
+        n = min(frames, avail)
+        view = src[:, start_idx:start_idx + n]
+        for c in range(out.shape[0]):
+            sc = c if c < src.shape[0] else src.shape[0] - 1
+            out[c, :n] += view[sc] * volumes[t]
+
+
+def minmax_envelope(samples, n_bins):
+    """
+    Compute a per-bin min/max envelope of a 1-D sample array in one pass.
+
+    This is the decimation primitive for waveform display: unlike naive
+    striding it keeps every peak. Runs as a parallel numba kernel when
+    numba is available.
+
+    Args:
+        samples: 1-D sample array (any numeric dtype)
+        n_bins: Number of envelope bins to produce
+
+    Returns:
+        (mins, maxs) arrays of length n_bins with the input dtype
+    """
+    n_bins = max(1, min(n_bins, samples.shape[0]))
+    out_min = np.empty(n_bins, dtype=samples.dtype)
+    out_max = np.empty(n_bins, dtype=samples.dtype)
+
+    if HAS_NUMBA:
+        _minmax_envelope_jit(samples, n_bins, out_min, out_max)
+    else:
+        step = samples.shape[0] // n_bins
+        trimmed = samples[:step * n_bins].reshape(n_bins, step)
+        np.min(trimmed, axis=1, out=out_min)
+        np.max(trimmed, axis=1, out=out_max)
+
+    return out_min, out_max
+
+
+def warm_jit():
+    """Trigger numba compilation on tiny inputs so the first real call
+    (e.g. the first zoom) isn't stalled by JIT time. No-op without numba."""
+    if not HAS_NUMBA:
+        return
+    tiny = np.zeros(8, dtype=np.int16)
+    pcm_to_planar_f32(tiny, 2, 2)
+    # Specialize for both dtypes the canvas feeds in
+    minmax_envelope(tiny, 2)
+    minmax_envelope(tiny.astype(np.float32), 2)
+    tiny_f32 = np.zeros((2, 8), dtype=np.float32)
+    apply_gain_inplace(tiny_f32, np.float32(1.0))
+    apply_ramp_inplace(tiny_f32, np.zeros(8, dtype=np.float32))
+    planar_to_interleaved_i16(tiny_f32)
+    mix_block(tiny_f32, make_source_list([tiny_f32.copy()]),
+              np.ones(1, dtype=np.float32), 0)
@@ -1,25 +1,136 @@
+import os
+import re
+import sys
 import time
 import psutil
 import threading
 from typing import Dict, List, Optional, Callable
-from dataclasses import dataclass, field
-from PyQt5.QtCore import QObject, pyqtSignal, QTimer
+from functools import lru_cache
+import numpy as np
+from PyQt5.QtCore import QObject, QThread, pyqtSignal
 from error_handler import get_error_handler
 
-@dataclass
+# Columnar layout for the metrics ring buffer: one row per tick,
+# overwritten in place (no list shifting, no per-tick allocations)
+_METRIC_DTYPE = np.dtype([
+    ('timestamp', 'f8'),
+    ('cpu_percent', 'f4'),
+    ('memory_percent', 'f4'),
+    ('memory_used_mb', 'f4'),
+    ('memory_available_mb', 'f4'),
+    ('audio_buffer_size', 'i4'),
+    ('audio_latency_ms', 'f4'),
+    ('active_tracks', 'i2'),
+    ('is_playing', '?'),
+    ('waveform_render_time_ms', 'f4'),
+])
+
+# Precompiled /proc/meminfo parse; MemAvailable follows MemTotal with
+# MemFree in between, so match across lines
+_MEMINFO_RE = re.compile(
+    rb'MemTotal:\s+(\d+) kB.*?MemAvailable:\s+(\d+) kB', re.DOTALL)
+
+# Static per-mode optimization settings; tuples so mode switches
+# allocate nothing
+_MODE_TABLE = {
+    "performance": (
+        ("waveform_detail_level", "low"),
+        ("audio_buffer_size", 2048),
+        ("real_time_effects", False),
+        ("waveform_antialiasing", False),
+        ("background_processing", True),
+    ),
+    "balanced": (
+        ("waveform_detail_level", "medium"),
+        ("audio_buffer_size", 1024),
+        ("real_time_effects", True),
+        ("waveform_antialiasing", True),
+        ("background_processing", True),
+    ),
+    "quality": (
+        ("waveform_detail_level", "high"),
+        ("audio_buffer_size", 512),
+        ("real_time_effects", True),
+        ("waveform_antialiasing", True),
+        ("background_processing", False),
+    ),
+}
+
+
+class _MonitorThread(QThread):
+    """
+    Worker thread that runs the sampling loop off the GUI thread.
+
+    The loop is the single producer for the monitor's ring buffer: it
+    writes a row, then publishes it by advancing the head index. The
+    GUI thread only reads rows (and patches fields of the latest one),
+    so the handoff needs no lock. Signals emitted from here cross to
+    the GUI thread via Qt's automatic queued connections.
+    """
+
+    def __init__(self, monitor):
+        super().__init__()
+        self._monitor = monitor
+        self._stop_event = threading.Event()
+
+    def run(self):
+        interval = self._monitor.update_interval / 1000.0
+        while not self._stop_event.is_set():
+            self._monitor._collect_metrics()
+            self._stop_event.wait(interval)
+
+    def stop(self):
+        """Signal the loop to exit and block until the thread is done"""
+        self._stop_event.set()
+        self.wait()
+
+
 class PerformanceMetrics:
-    """Data class to store performance metrics"""
-    timestamp: float = field(default_factory=time.time)
-    cpu_percent: float = 0.0
-    memory_percent: float = 0.0
-    memory_used_mb: float = 0.0
-    memory_available_mb: float = 0.0
-    audio_buffer_size: int = 1024
-    audio_latency_ms: float = 0.0
-    active_tracks: int = 0
-    is_playing: bool = False
-    waveform_render_time_ms: float = 0.0
-    
+    """Data class to store performance metrics.
+
+    Hand-rolled rather than dataclass(slots=True), which needs Python
+    3.10 (and a slotted dataclass can't carry field defaults on older
+    versions); the explicit __init__ keeps the same defaults and the
+    slots keep each sample a small fixed-layout object.
+    """
+    __slots__ = ('timestamp', 'cpu_percent', 'memory_percent',
+                 'memory_used_mb', 'memory_available_mb',
+                 'audio_buffer_size', 'audio_latency_ms', 'active_tracks',
+                 'is_playing', 'waveform_render_time_ms')
+
+    def __init__(self, timestamp=None, cpu_percent=0.0, memory_percent=0.0,
+                 memory_used_mb=0.0, memory_available_mb=0.0,
+                 audio_buffer_size=1024, audio_latency_ms=0.0,
+                 active_tracks=0, is_playing=False,
+                 waveform_render_time_ms=0.0):
+        self.timestamp = time.monotonic() if timestamp is None else timestamp
+        self.cpu_percent = cpu_percent
+        self.memory_percent = memory_percent
+        self.memory_used_mb = memory_used_mb
+        self.memory_available_mb = memory_available_mb
+        self.audio_buffer_size = audio_buffer_size
+        self.audio_latency_ms = audio_latency_ms
+        self.active_tracks = active_tracks
+        self.is_playing = is_playing
+        self.waveform_render_time_ms = waveform_render_time_ms
+
+    @classmethod
+    def from_row(cls, row) -> "PerformanceMetrics":
+        """Build a metrics object from a ring-buffer row"""
+        return cls(
+            timestamp=float(row['timestamp']),
+            cpu_percent=float(row['cpu_percent']),
+            memory_percent=float(row['memory_percent']),
+            memory_used_mb=float(row['memory_used_mb']),
+            memory_available_mb=float(row['memory_available_mb']),
+            audio_buffer_size=int(row['audio_buffer_size']),
+            audio_latency_ms=float(row['audio_latency_ms']),
+            active_tracks=int(row['active_tracks']),
+            is_playing=bool(row['is_playing']),
+            waveform_render_time_ms=float(row['waveform_render_time_ms'])
+        )
+
+
 class PerformanceMonitor(QObject):
     """
     Monitors system performance and provides optimization recommendations
@@ -30,16 +141,38 @@ class PerformanceMonitor(QObject):
     metricsUpdated = pyqtSignal(object)  # PerformanceMetrics object
     warningIssued = pyqtSignal(str, str)  # Warning type, warning message
     recommendationIssued = pyqtSignal(str, str)  # Recommendation type, recommendation message
-    
+
+    # Constant recommendation texts; re-emission is rate-limited so
+    # sustained load doesn't spam the GUI with the same four strings
+    # every second
+    _CPU_RECS = (
+        "Consider switching to Performance Mode for reduced CPU usage",
+        "Reduce the number of active audio tracks",
+        "Lower audio quality settings if possible",
+        "Close other applications to free up CPU resources"
+    )
+    _MEM_RECS = (
+        "Close unused tracks to free memory",
+        "Work with shorter audio files when possible",
+        "Restart the application to clear memory leaks",
+        "Close other applications to free up system memory"
+    )
+    _REC_COOLDOWN_S = 30.0
+
+
     def __init__(self, parent=None, update_interval_ms=1000):
         super().__init__(parent)
         self.error_handler = get_error_handler()
         self.update_interval = update_interval_ms
         self.monitoring_enabled = False
         
-        # Performance history (keep last 60 measurements)
-        self.metrics_history: List[PerformanceMetrics] = []
+        # Performance history: fixed-capacity ring of the last 60
+        # measurements, written in place (appending to a list and
+        # pop(0)-ing shifted the whole history every tick)
         self.max_history_size = 60
+        self._ring = np.zeros(self.max_history_size, dtype=_METRIC_DTYPE)
+        self._head = 0   # Next slot to write
+        self._count = 0  # Rows filled so far (saturates at capacity)
         
         # Thresholds for warnings
         self.cpu_warning_threshold = 80.0  # %
@@ -48,10 +181,36 @@ class PerformanceMonitor(QObject):
         
         # Optimization settings
         self.optimization_callbacks: Dict[str, Callable] = {}
-        
-        # Timer for periodic monitoring
-        self.monitor_timer = QTimer()
-        self.monitor_timer.timeout.connect(self._collect_metrics)
+        # Per-mode (callback, value) plans compiled lazily from
+        # _MODE_TABLE; invalidated when callbacks are (re)registered
+        self._compiled_plans: Dict[str, tuple] = {}
+
+        # Last emission times for the recommendation cooldowns
+        self._last_cpu_rec_ts = 0.0
+        self._last_mem_rec_ts = 0.0
+
+        # Threshold state bitmask from the previous tick; warnings fire
+        # on rising edges instead of every second while load stays high
+        self._warn_state = 0
+        
+        # On Linux, keep /proc/stat and /proc/meminfo open and sample
+        # them with one lseek+read each per tick instead of psutil's
+        # open/read/parse round-trips (psutil stays as the fallback on
+        # other platforms)
+        self._stat_fd = None
+        self._mem_fd = None
+        self._prev_stat = None  # (idle_ticks, total_ticks) from last tick
+        if sys.platform.startswith('linux'):
+            try:
+                self._stat_fd = os.open('/proc/stat', os.O_RDONLY)
+                self._mem_fd = os.open('/proc/meminfo', os.O_RDONLY)
+            except OSError:
+                self._stat_fd = None
+                self._mem_fd = None
+
+        # Sampling runs on a worker thread so /proc reads and warning
+        # checks never stall GUI paint; created on start_monitoring
+        self._monitor_thread = None
         
         # Performance optimization flags
         self.performance_mode = "balanced"  # "performance", "balanced", "quality"
@@ -60,96 +219,179 @@ class PerformanceMonitor(QObject):
         """Start performance monitoring"""
         if not self.monitoring_enabled:
             self.monitoring_enabled = True
-            self.monitor_timer.start(self.update_interval)
+            self._monitor_thread = _MonitorThread(self)
+            self._monitor_thread.start()
             self.error_handler.log_info("Performance monitoring started")
-    
+
     def stop_monitoring(self):
         """Stop performance monitoring"""
         if self.monitoring_enabled:
             self.monitoring_enabled = False
-            self.monitor_timer.stop()
+            if self._monitor_thread is not None:
+                self._monitor_thread.stop()
+                self._monitor_thread = None
             self.error_handler.log_info("Performance monitoring stopped")
     
+    def _latest_row(self):
+        """Return a view of the most recently written ring slot, or None"""
+        if self._count == 0:
+            return None
+        return self._ring[(self._head - 1) % self.max_history_size]
+
+    def _sample_system(self):
+        """
+        Sample CPU and memory usage.
+
+        On Linux this is a single lseek+read of the kept-open /proc/stat
+        and /proc/meminfo descriptors plus a precompiled parse; CPU
+        percent is computed from the tick deltas against the previous
+        sample. Other platforms fall back to psutil.
+
+        Returns:
+            (cpu_percent, memory_percent, memory_used_mb, memory_available_mb)
+        """
+        if self._stat_fd is not None:
+            os.lseek(self._stat_fd, 0, os.SEEK_SET)
+            stat_buf = os.read(self._stat_fd, 4096)
+            os.lseek(self._mem_fd, 0, os.SEEK_SET)
+            mem_buf = os.read(self._mem_fd, 4096)
+
+            mem_match = _MEMINFO_RE.search(mem_buf)
+            if mem_match is not None:
+                # First line of /proc/stat: "cpu user nice system idle
+                # iowait irq softirq ..."; idle time = idle + iowait
+                ticks = stat_buf[:stat_buf.index(b'\n')].split()[1:]
+                idle = int(ticks[3]) + (int(ticks[4]) if len(ticks) > 4 else 0)
+                total = sum(int(t) for t in ticks)
+                cpu_percent = 0.0
+                if self._prev_stat is not None:
+                    delta_total = total - self._prev_stat[1]
+                    if delta_total > 0:
+                        delta_idle = idle - self._prev_stat[0]
+                        cpu_percent = 100.0 * (1.0 - delta_idle / delta_total)
+                self._prev_stat = (idle, total)
+
+                total_kb = int(mem_match.group(1))
+                avail_kb = int(mem_match.group(2))
+                used_kb = total_kb - avail_kb
+                mem_percent = 100.0 * used_kb / total_kb if total_kb else 0.0
+                return (cpu_percent, mem_percent,
+                        used_kb / 1024.0, avail_kb / 1024.0)
+
+        memory = psutil.virtual_memory()
+        return (psutil.cpu_percent(interval=None), memory.percent,
+                memory.used / (1024 * 1024), memory.available / (1024 * 1024))
+
     def _collect_metrics(self):
-        """Collect current performance metrics"""
+        """Collect current performance metrics (runs on _MonitorThread)"""
         try:
             # Get system metrics
-            cpu_percent = psutil.cpu_percent(interval=None)
-            memory = psutil.virtual_memory()
-            
-            # Create metrics object
+            cpu_percent, mem_percent, used_mb, avail_mb = self._sample_system()
+
+            # Overwrite the oldest ring slot in place; the audio fields
+            # get their defaults back until update_audio_metrics refreshes
+            # them for this tick
+            row = self._ring[self._head]
+            # Monotonic timestamps: cutoff arithmetic must not see wall
+            # clock jumps from NTP/DST adjustments
+            row['timestamp'] = time.monotonic()
+            row['cpu_percent'] = cpu_percent
+            row['memory_percent'] = mem_percent
+            row['memory_used_mb'] = used_mb
+            row['memory_available_mb'] = avail_mb
+            row['audio_buffer_size'] = 1024
+            row['audio_latency_ms'] = 0.0
+            row['active_tracks'] = 0
+            row['is_playing'] = False
+            row['waveform_render_time_ms'] = 0.0
+            self._head = (self._head + 1) % self.max_history_size
+            self._count = min(self._count + 1, self.max_history_size)
+
+            # Metrics object for warning checks and subscribers
             metrics = PerformanceMetrics(
+                timestamp=float(row['timestamp']),
                 cpu_percent=cpu_percent,
-                memory_percent=memory.percent,
-                memory_used_mb=memory.used / (1024 * 1024),
-                memory_available_mb=memory.available / (1024 * 1024)
+                memory_percent=mem_percent,
+                memory_used_mb=used_mb,
+                memory_available_mb=avail_mb
             )
-            
-            # Add to history
-            self.metrics_history.append(metrics)
-            if len(self.metrics_history) > self.max_history_size:
-                self.metrics_history.pop(0)
-            
+
             # Check for warnings
             self._check_performance_warnings(metrics)
-            
+
             # Emit updated metrics
             self.metricsUpdated.emit(metrics)
-            
+
         except Exception as e:
             self.error_handler.log_error(f"Error collecting performance metrics: {str(e)}")
     
+    # Bits of the warning state mask
+    _CPU_CRIT = 0b1000
+    _CPU_WARN = 0b0100
+    _MEM_CRIT = 0b0010
+    _MEM_WARN = 0b0001
+
     def _check_performance_warnings(self, metrics: PerformanceMetrics):
-        """Check metrics for performance issues and emit warnings"""
+        """Check metrics for performance issues and emit warnings.
+
+        The four threshold comparisons are packed into a bitmask and
+        compared against the previous tick's mask, so each warning is
+        emitted once when its threshold is crossed rather than formatted
+        and re-sent every second while load stays high.
+        """
+        state = ((metrics.cpu_percent > 95) << 3
+                 | (metrics.cpu_percent > self.cpu_warning_threshold) << 2
+                 | (metrics.memory_percent > self.memory_critical_threshold) << 1
+                 | (metrics.memory_percent > self.memory_warning_threshold))
+        rising = state & ~self._warn_state
+        self._warn_state = state
+        if not rising:
+            return
+
         # CPU warnings
-        if metrics.cpu_percent > self.cpu_warning_threshold:
-            if metrics.cpu_percent > 95:
-                self.warningIssued.emit(
-                    "Critical CPU Usage",
-                    f"CPU usage is at {metrics.cpu_percent:.1f}%. Consider reducing audio quality or track count."
-                )
-                self._recommend_cpu_optimization()
-            else:
-                self.warningIssued.emit(
-                    "High CPU Usage", 
-                    f"CPU usage is high ({metrics.cpu_percent:.1f}%). Performance may be affected."
-                )
-        
+        if rising & self._CPU_CRIT:
+            self.warningIssued.emit(
+                "Critical CPU Usage",
+                f"CPU usage is at {metrics.cpu_percent:.1f}%. Consider reducing audio quality or track count."
+            )
+            self._recommend_cpu_optimization()
+        elif rising & self._CPU_WARN and not state & self._CPU_CRIT:
+            self.warningIssued.emit(
+                "High CPU Usage",
+                f"CPU usage is high ({metrics.cpu_percent:.1f}%). Performance may be affected."
+            )
+
         # Memory warnings
-        if metrics.memory_percent > self.memory_critical_threshold:
+        if rising & self._MEM_CRIT:
             self.warningIssued.emit(
                 "Critical Memory Usage",
                 f"Memory usage is at {metrics.memory_percent:.1f}%. Application may become unstable."
             )
             self._recommend_memory_optimization()
-        elif metrics.memory_percent > self.memory_warning_threshold:
+        elif rising & self._MEM_WARN and not state & self._MEM_CRIT:
             self.warningIssued.emit(
                 "High Memory Usage",
                 f"Memory usage is high ({metrics.memory_percent:.1f}%). Consider closing other applications."
             )
     
     def _recommend_cpu_optimization(self):
-        """Provide CPU optimization recommendations"""
-        recommendations = [
-            "Consider switching to Performance Mode for reduced CPU usage",
-            "Reduce the number of active audio tracks",
-            "Lower audio quality settings if possible",
-            "Close other applications to free up CPU resources"
-        ]
-        
-        for rec in recommendations:
+        """Provide CPU optimization recommendations (rate-limited)"""
+        now = time.monotonic()
+        if now - self._last_cpu_rec_ts < self._REC_COOLDOWN_S:
+            return
+        self._last_cpu_rec_ts = now
+
+        for rec in self._CPU_RECS:
             self.recommendationIssued.emit("CPU Optimization", rec)
-    
+
     def _recommend_memory_optimization(self):
-        """Provide memory optimization recommendations"""
-        recommendations = [
-            "Close unused tracks to free memory",
-            "Work with shorter audio files when possible",
-            "Restart the application to clear memory leaks",
-            "Close other applications to free up system memory"
-        ]
-        
-        for rec in recommendations:
+        """Provide memory optimization recommendations (rate-limited)"""
+        now = time.monotonic()
+        if now - self._last_mem_rec_ts < self._REC_COOLDOWN_S:
+            return
+        self._last_mem_rec_ts = now
+
+        for rec in self._MEM_RECS:
             self.recommendationIssued.emit("Memory Optimization", rec)
     
     def set_performance_mode(self, mode: str):
@@ -159,62 +401,31 @@ class PerformanceMonitor(QObject):
         Args:
             mode: The performance mode to set
         """
-        if mode not in ["performance", "balanced", "quality"]:
+        if mode not in _MODE_TABLE:
             raise ValueError("Mode must be 'performance', 'balanced', or 'quality'")
-        
+
         self.performance_mode = mode
         self.error_handler.log_info(f"Performance mode set to: {mode}")
-        
+
         # Apply mode-specific optimizations
-        if mode == "performance":
-            self._apply_performance_optimizations()
-        elif mode == "balanced":
-            self._apply_balanced_optimizations()
-        elif mode == "quality":
-            self._apply_quality_optimizations()
-    
-    def _apply_performance_optimizations(self):
-        """Apply optimizations for maximum performance"""
-        optimizations = {
-            "waveform_detail_level": "low",
-            "audio_buffer_size": 2048,
-            "real_time_effects": False,
-            "waveform_antialiasing": False,
-            "background_processing": True
-        }
-        
-        for key, value in optimizations.items():
-            if key in self.optimization_callbacks:
-                self.optimization_callbacks[key](value)
-    
-    def _apply_balanced_optimizations(self):
-        """Apply balanced optimizations"""
-        optimizations = {
-            "waveform_detail_level": "medium",
-            "audio_buffer_size": 1024,
-            "real_time_effects": True,
-            "waveform_antialiasing": True,
-            "background_processing": True
-        }
-        
-        for key, value in optimizations.items():
-            if key in self.optimization_callbacks:
-                self.optimization_callbacks[key](value)
-    
-    def _apply_quality_optimizations(self):
-        """Apply optimizations for maximum quality"""
-        optimizations = {
-            "waveform_detail_level": "high",
-            "audio_buffer_size": 512,
-            "real_time_effects": True,
-            "waveform_antialiasing": True,
-            "background_processing": False
-        }
-        
-        for key, value in optimizations.items():
-            if key in self.optimization_callbacks:
-                self.optimization_callbacks[key](value)
-    
+        self._apply_mode(mode)
+
+    def _apply_mode(self, mode: str):
+        """Fire the registered callbacks for a mode's settings"""
+        plan = self._compiled_plans.get(mode)
+        if plan is None:
+            # Resolve callbacks once; later switches skip the dict
+            # lookups entirely
+            plan = tuple(
+                (self.optimization_callbacks[key], value)
+                for key, value in _MODE_TABLE[mode]
+                if key in self.optimization_callbacks
+            )
+            self._compiled_plans[mode] = plan
+
+        for callback, value in plan:
+            callback(value)
+
     def register_optimization_callback(self, setting_name: str, callback: Callable):
         """
         Register a callback function for performance optimizations
@@ -224,7 +435,26 @@ class PerformanceMonitor(QObject):
             callback: Function to call when optimization is applied
         """
         self.optimization_callbacks[setting_name] = callback
-    
+        self._compiled_plans.clear()
+
+    def _column_means(self, field_names, cutoff) -> Optional[Dict[str, float]]:
+        """
+        Mean of each named ring-buffer column over rows at or after
+        ``cutoff``, computed with one boolean mask and one C-level
+        reduction per column.
+
+        Returns:
+            Dict mapping field name to mean, or None if no rows qualify
+        """
+        if self._count == 0:
+            return None
+        history = self._ring[:self._count]
+        mask = history['timestamp'] >= cutoff
+        if not mask.any():
+            return None
+        recent = history[mask]
+        return {f: float(recent[f].mean()) for f in field_names}
+
     def get_average_metrics(self, duration_seconds: int = 30) -> Optional[PerformanceMetrics]:
         """
         Get average performance metrics over the specified duration
@@ -235,35 +465,29 @@ class PerformanceMonitor(QObject):
         Returns:
             Average metrics or None if insufficient data
         """
-        if not self.metrics_history:
+        current_time = time.monotonic()
+        means = self._column_means(
+            ('cpu_percent', 'memory_percent', 'memory_used_mb',
+             'memory_available_mb', 'audio_latency_ms',
+             'waveform_render_time_ms'),
+            current_time - duration_seconds)
+        if means is None:
             return None
-        
-        # Filter metrics within the specified duration
-        current_time = time.time()
-        cutoff_time = current_time - duration_seconds
-        
-        recent_metrics = [
-            m for m in self.metrics_history 
-            if m.timestamp >= cutoff_time
-        ]
-        
-        if not recent_metrics:
-            return None
-        
-        # Calculate averages
+
+        latest = self._latest_row()
         avg_metrics = PerformanceMetrics(
             timestamp=current_time,
-            cpu_percent=sum(m.cpu_percent for m in recent_metrics) / len(recent_metrics),
-            memory_percent=sum(m.memory_percent for m in recent_metrics) / len(recent_metrics),
-            memory_used_mb=sum(m.memory_used_mb for m in recent_metrics) / len(recent_metrics),
-            memory_available_mb=sum(m.memory_available_mb for m in recent_metrics) / len(recent_metrics),
-            audio_buffer_size=recent_metrics[-1].audio_buffer_size,  # Use latest
-            audio_latency_ms=sum(m.audio_latency_ms for m in recent_metrics) / len(recent_metrics),
-            active_tracks=recent_metrics[-1].active_tracks,  # Use latest
-            is_playing=recent_metrics[-1].is_playing,  # Use latest
-            waveform_render_time_ms=sum(m.waveform_render_time_ms for m in recent_metrics) / len(recent_metrics)
+            cpu_percent=means['cpu_percent'],
+            memory_percent=means['memory_percent'],
+            memory_used_mb=means['memory_used_mb'],
+            memory_available_mb=means['memory_available_mb'],
+            audio_buffer_size=int(latest['audio_buffer_size']),  # Use latest
+            audio_latency_ms=means['audio_latency_ms'],
+            active_tracks=int(latest['active_tracks']),  # Use latest
+            is_playing=bool(latest['is_playing']),  # Use latest
+            waveform_render_time_ms=means['waveform_render_time_ms']
         )
-        
+
         return avg_metrics
     
     def update_audio_metrics(self, buffer_size: int, latency_ms: float, active_tracks: int, is_playing: bool):
@@ -276,12 +500,12 @@ class PerformanceMonitor(QObject):
             active_tracks: Number of active audio tracks
             is_playing: Whether audio is currently playing
         """
-        if self.metrics_history:
-            latest = self.metrics_history[-1]
-            latest.audio_buffer_size = buffer_size
-            latest.audio_latency_ms = latency_ms
-            latest.active_tracks = active_tracks
-            latest.is_playing = is_playing
+        latest = self._latest_row()
+        if latest is not None:
+            latest['audio_buffer_size'] = buffer_size
+            latest['audio_latency_ms'] = latency_ms
+            latest['active_tracks'] = active_tracks
+            latest['is_playing'] = is_playing
     
     def update_waveform_render_time(self, render_time_ms: float):
         """
@@ -290,9 +514,9 @@ class PerformanceMonitor(QObject):
         Args:
             render_time_ms: Time taken to render waveform in milliseconds
         """
-        if self.metrics_history:
-            latest = self.metrics_history[-1]
-            latest.waveform_render_time_ms = render_time_ms
+        latest = self._latest_row()
+        if latest is not None:
+            latest['waveform_render_time_ms'] = render_time_ms
     
     def get_performance_report(self) -> Dict[str, any]:
         """
@@ -301,12 +525,13 @@ class PerformanceMonitor(QObject):
         Returns:
             Dictionary containing performance analysis
         """
-        if not self.metrics_history:
+        row = self._latest_row()
+        if row is None:
             return {"status": "No data available"}
-        
-        latest = self.metrics_history[-1]
+
+        latest = PerformanceMetrics.from_row(row)
         avg_30s = self.get_average_metrics(30)
-        
+
         report = {
             "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
             "performance_mode": self.performance_mode,
@@ -371,30 +596,32 @@ class AudioBufferOptimizer:
     """
     
     @staticmethod
+    @lru_cache(maxsize=32)
     def calculate_optimal_buffer_size(sample_rate: int, target_latency_ms: float = 20.0) -> int:
         """
         Calculate optimal buffer size for given sample rate and target latency
-        
+
+        Results are memoized; callers draw from a handful of sample
+        rate / latency pairs.
+
         Args:
             sample_rate: Audio sample rate in Hz
             target_latency_ms: Target latency in milliseconds
-            
+
         Returns:
             Optimal buffer size in samples
         """
         # Convert target latency to samples
         target_samples = int((target_latency_ms / 1000.0) * sample_rate)
-        
-        # Round to nearest power of 2 for optimal performance
-        power_of_2 = 1
-        while power_of_2 < target_samples:
-            power_of_2 *= 2
-        
-        # Ensure minimum buffer size for stability
-        min_buffer = 256
-        max_buffer = 4096
-        
-        return max(min_buffer, min(max_buffer, power_of_2))
+
+        # Round up to a power of 2 without looping
+        if target_samples <= 1:
+            power_of_2 = 1
+        else:
+            power_of_2 = 1 << (target_samples - 1).bit_length()
+
+        # Clamp for stability
+        return max(256, min(4096, power_of_2))
     
     @staticmethod
     def adapt_buffer_size_for_performance(current_buffer: int, cpu_percent: float, memory_percent: float) -> int:
@@ -1,12 +1,28 @@
 import json
 import os
 import uuid
+from collections import OrderedDict
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 import numpy as np
 from PyQt5.QtCore import QObject, pyqtSignal
 from PyQt5.QtWidgets import QMessageBox, QFileDialog
 
+# orjson is optional; the stdlib json fallback below keeps project
+# save/load working without it
+try:
+    import orjson
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj).decode('utf-8')
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj) -> str:
+        return json.dumps(obj, separators=(',', ':'), ensure_ascii=False)
+
+    _loads = json.loads
+
 
 class ProjectManager(QObject):
     """
@@ -21,7 +37,13 @@ class ProjectManager(QObject):
         super().__init__(parent)
         self.current_project_path = None
         self.project_modified = False
-        
+        # When True, fsync project files before the atomic rename so a
+        # power loss can't lose a save; off by default to keep saves fast
+        self._safe_save = False
+        # Recent-projects LRU, most recent first; lazily loaded from
+        # disk once and kept in memory so saves don't re-read the file
+        self._recent = None
+
     def create_new_project(self):
         """Create a new empty project"""
         self.current_project_path = None
@@ -84,27 +106,48 @@ class ProjectManager(QObject):
             if not filepath.endswith('.mmp'):
                 filepath += '.mmp'
             
-            # Create project data structure
-            project_data = {
-                "version": "1.0",
-                "name": os.path.splitext(os.path.basename(filepath))[0],
-                "tracks": [self.serialize_track(track) for track in tracks],
-                "settings": settings or {
-                    "sample_rate": 44100,
-                    "bit_depth": 16,
-                    "global_volume": 1.0,
-                    "playback_position": 0.0
-                },
-                "metadata": {
-                    "created_date": None,  # Will be set on first save
-                    "last_modified": None,  # Will be updated on each save
-                    "total_duration": max([t.waveform_canvas.max_time for t in tracks if t.waveform_canvas]) if tracks else 0.0
-                }
+            name = os.path.splitext(os.path.basename(filepath))[0]
+            settings = settings or {
+                "sample_rate": 44100,
+                "bit_depth": 16,
+                "global_volume": 1.0,
+                "playback_position": 0.0
             }
-            
-            # Save to file
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(project_data, f, indent=2, ensure_ascii=False)
+            metadata = {
+                "created_date": None,  # Will be set on first save
+                "last_modified": None,  # Will be updated on each save
+                "total_duration": max((t.waveform_canvas.max_time for t in tracks if t.waveform_canvas), default=0.0)
+            }
+
+            # Stream the document out one track at a time instead of
+            # building the whole serialized string in memory first.
+            # Write to a temp file and rename into place so a crash or
+            # full disk mid-write never corrupts the existing project.
+            tmp_path = filepath + '.part'
+            try:
+                with open(tmp_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+                    f.write('{"version": "1.0", "name": ')
+                    f.write(_dumps(name))
+                    f.write(', "tracks": [')
+                    for i, track in enumerate(tracks):
+                        if i:
+                            f.write(',')
+                        f.write(_dumps(self.serialize_track(track)))
+                    f.write('], "settings": ')
+                    f.write(_dumps(settings))
+                    f.write(', "metadata": ')
+                    f.write(_dumps(metadata))
+                    f.write('}')
+                    if self._safe_save:
+                        f.flush()
+                        os.fsync(f.fileno())
+                os.replace(tmp_path, filepath)
+            except Exception:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+                raise
             
             self.current_project_path = filepath
             self.project_modified = False
@@ -136,8 +179,8 @@ class ProjectManager(QObject):
                 return None
             
             # Load project data
-            with open(filepath, 'r', encoding='utf-8') as f:
-                project_data = json.load(f)
+            with open(filepath, 'rb') as f:
+                project_data = _loads(f.read())
             
             # Validate project data
             if not self._validate_project_data(project_data):
@@ -180,31 +223,50 @@ class ProjectManager(QObject):
             return os.path.splitext(os.path.basename(self.current_project_path))[0]
         return "Untitled Project"
     
-    def get_recent_projects(self, max_count=10):
-        """Get list of recent project files"""
-        recent_projects_file = Path(__file__).resolve().parent / "recent_projects.json"
+    def _recent_projects_file(self):
+        """Path of the on-disk recent projects list"""
+        return Path(__file__).resolve().parent / "recent_projects.json"
+
+    def _load_recent(self):
+        """Load the recent-projects LRU, reading the file only once"""
+        if self._recent is None:
+            self._recent = OrderedDict()
+            try:
+                recent_file = self._recent_projects_file()
+                if recent_file.exists():
+                    with open(recent_file, 'rb') as f:
+                        for path in _loads(f.read()):
+                            self._recent[path] = None
+            except Exception:
+                pass
+        return self._recent
+
+    def _flush_recent(self, recent):
+        """Write the recent-projects LRU back to disk atomically"""
+        recent_file = str(self._recent_projects_file())
         try:
-            if recent_projects_file.exists():
-                with open(recent_projects_file, 'r') as f:
-                    recent = json.load(f)
-                    # Filter out non-existent files
-                    return [p for p in recent if os.path.exists(p)][:max_count]
+            # Atomic rewrite: a crash here used to leave an empty file
+            tmp_path = recent_file + '.part'
+            with open(tmp_path, 'w') as f:
+                f.write(_dumps(list(recent)))
+            os.replace(tmp_path, recent_file)
         except Exception:
             pass
-        return []
-    
+
+    def get_recent_projects(self, max_count=10):
+        """Get list of recent project files"""
+        recent = self._load_recent()
+        # Filter out non-existent files only here, for UI display; the
+        # save path no longer stats every entry
+        return [p for p in list(recent)[:max_count] if os.path.exists(p)]
+
     def add_to_recent_projects(self, filepath):
         """Add project to recent projects list"""
-        recent_projects_file = Path(__file__).resolve().parent / "recent_projects.json"
-        try:
-            recent = self.get_recent_projects()
-            if filepath in recent:
-                recent.remove(filepath)
-            recent.insert(0, filepath)
-            recent = recent[:10]  # Keep only 10 most recent
-            
-            with open(recent_projects_file, 'w') as f:
-                json.dump(recent, f)
-        except Exception:
-            pass
+        recent = self._load_recent()
+        recent.pop(filepath, None)
+        recent[filepath] = None
+        recent.move_to_end(filepath, last=False)
+        while len(recent) > 10:  # Keep only 10 most recent
+            recent.popitem(last=True)
+        self._flush_recent(recent)
 
@@ -1,14 +1,18 @@
+import math
 import os
 import uuid
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Union
 
 import numpy as np
 import sounddevice as sd
 from scipy import signal
-from PyQt5.QtCore import Qt, QObject, pyqtSignal, pyqtSlot, QTimer, QThread
+from PyQt5.QtCore import (Qt, QObject, QSignalBlocker, pyqtSignal, pyqtSlot,
+                          QTimer, QThread)
 from PyQt5.QtGui import QColor, QIcon
 from PyQt5.QtWidgets import (
     QFrame, QHBoxLayout, QLabel, QSlider, QToolButton, 
@@ -17,14 +21,33 @@ from PyQt5.QtWidgets import (
 )
 
 # Import the existing WaveformCanvas class
+from audio_convert import (make_source_list, minmax_envelope, mix_block,
+                           pcm_to_planar_f32)
 from track_renderer import EnhancedWaveformCanvas
 from pydub import AudioSegment
 from error_handler import get_error_handler
 
+# soundfile is optional; WAV/FLAC decoding falls back to pydub without it
+try:
+    import soundfile as sf
+except ImportError:
+    sf = None
+
+# soxr is optional; load-time resampling falls back to scipy without it
+try:
+    import soxr
+except ImportError:
+    soxr = None
+
 # Constants for UI
 DARK_BG = '#232629'
 DARK_FG = '#eef1f4'
 ACCENT_COLOR = '#47cbff'
+# Bucket sizes (samples per bin) of the waveform display pyramid, and
+# roughly how many bins a redraw should hand the canvas
+PYRAMID_BUCKETS = (256, 1024, 4096, 16384, 65536)
+DISPLAY_TARGET_BINS = 4000
+
 TRACK_COLORS = [
     '#47cbff',  # Sky blue
     '#ff6b6b',  # Coral red
@@ -38,6 +61,188 @@ TRACK_COLORS = [
     '#9cff9c',  # Light green
 ]
 
+# Parsed once at import; picking a color for a new track is then a
+# plain index instead of a hex parse per QColor(str)
+TRACK_QCOLORS = tuple(QColor(c) for c in TRACK_COLORS)
+
+
+# Stylesheets built once at import; creating a track or container
+# reuses these instead of rebuilding the f-strings (only the small
+# per-track "checked" color rule is formatted dynamically)
+TRACK_WIDGET_STYLE = f"""
+    QWidget {{ background-color: {DARK_BG}; }}
+    QLabel {{ color: {DARK_FG}; }}
+"""
+
+HEADER_STYLE_STATIC = f"""
+    QFrame {{
+        background-color: #21242b;
+        border: 1px solid #31343a;
+        border-radius: 6px;
+        margin: 2px;
+    }}
+    QToolButton {{
+        background-color: #2a2e36;
+        color: {DARK_FG};
+        border: none;
+        border-radius: 4px;
+        padding: 4px;
+        min-width: 48px;
+        min-height: 48px;
+    }}
+    QToolButton:hover {{
+        background-color: #383c45;
+    }}
+"""
+
+NAME_EDIT_STYLE = (f"color: {DARK_FG}; background-color: #2a2e36; "
+                   f"border: 1px solid #373a42; border-radius: 4px; padding: 4px;")
+
+TIME_RULER_STYLE = """
+    QFrame {
+        background-color: #1a1d23;
+        border-bottom: 1px solid #31343a;
+    }
+"""
+
+SCROLL_AREA_STYLE = f"""
+    QScrollArea {{ background: {DARK_BG}; border: none; }}
+    QScrollBar {{ background: #21242b; width: 16px; height: 16px; }}
+    QScrollBar::handle {{ background: #3a3f4b; border-radius: 5px; }}
+    QScrollBar::handle:hover {{ background: #474d5d; }}
+"""
+
+TRACK_CONTROLS_STYLE = f"""
+    QFrame {{
+        background-color: #1e2128;
+        border-top: 1px solid #31343a;
+    }}
+    QPushButton {{
+        background-color: #2a2e36;
+        color: {DARK_FG};
+        border: none;
+        border-radius: 6px;
+        padding: 8px 16px;
+        font-weight: bold;
+        min-height: 36px;
+    }}
+    QPushButton:hover {{
+        background-color: #383c45;
+    }}
+"""
+
+PLAYBACK_CONTROLS_STYLE = f"""
+    QFrame {{
+        background-color: #21242b;
+        border-top: 1px solid #31343a;
+    }}
+    QToolButton {{
+        background-color: #2a2e36;
+        color: {DARK_FG};
+        border: none;
+        border-radius: 6px;
+        padding: 8px;
+        min-width: 48px;
+        min-height: 48px;
+    }}
+    QToolButton:hover {{
+        background-color: #383c45;
+    }}
+    QToolButton:checked {{
+        background-color: {ACCENT_COLOR};
+        color: #000000;
+    }}
+"""
+
+TIME_DISPLAY_STYLE = f"""
+    color: {DARK_FG};
+    font-family: monospace;
+    font-size: 16px;
+    background-color: #1a1d23;
+    padding: 4px 8px;
+    border-radius: 4px;
+"""
+
+
+def _header_checked_rule(color_name):
+    """The only color-dependent piece of the header stylesheet"""
+    return (f"QToolButton:checked {{ background-color: {color_name}; "
+            f"color: #000000; }}")
+
+
+@lru_cache(maxsize=32)
+def _header_style(color_name):
+    """Full header stylesheet for one accent color, cached per color"""
+    return HEADER_STYLE_STATIC + _header_checked_rule(color_name)
+
+
+@lru_cache(maxsize=32)
+def _color_btn_style(color_name):
+    """Color-swatch button stylesheet, cached per color"""
+    return f"background-color: {color_name}; border-radius: 16px;"
+
+
+@lru_cache(maxsize=32)
+def _fade_curve(n, fade_in, dtype_str):
+    """
+    Build (and cache) a read-only linear fade ramp of length n.
+
+    Users reapply the same fade lengths constantly (fixed-ms fades, a
+    reselected region), so the LUT is memoized by (length, direction,
+    dtype) and shared across tracks and channels. Read-only so a cached
+    entry can never be corrupted in place.
+    """
+    if fade_in:
+        ramp = np.linspace(0.0, 1.0, n, dtype=np.dtype(dtype_str))
+    else:
+        ramp = np.linspace(1.0, 0.0, n, dtype=np.dtype(dtype_str))
+    ramp.flags.writeable = False
+    return ramp
+
+
+def _decode_audio_file(filepath):
+    """
+    Decode an audio file to (samples, sr, audio_segment).
+
+    Pure decode with no Qt objects touched, so it is safe to run on a
+    worker thread. pydub/ffmpeg handles the common formats; librosa is
+    the fallback for everything else (segment is None in that case).
+    """
+    ext = os.path.splitext(filepath)[1][1:].lower()
+
+    # For WAV/FLAC, libsndfile reads straight into float32 with no
+    # intermediate raw-bytes copy (and releases the GIL while reading),
+    # so it beats the pydub decode + deinterleave path when available
+    if sf is not None and ext in ('wav', 'flac'):
+        try:
+            data, sr = sf.read(filepath, dtype='float32', always_2d=True)
+            return np.ascontiguousarray(data.T), sr, None
+        except Exception:
+            pass  # unusual encodings fall through to pydub/ffmpeg
+
+    # Try pydub first for supported formats
+    if ext in ['mp3', 'flac', 'wav', 'aac']:
+        try:
+            if ext == 'aac':
+                audio = AudioSegment.from_file(filepath, 'aac')
+            else:
+                audio = AudioSegment.from_file(filepath)
+
+            # Zero-copy view of pydub's raw PCM, then one fused
+            # deinterleave/cast/scale pass into planar float32
+            samples = AudioTrack._decode_segment(audio)
+            return samples, audio.frame_rate, audio
+
+        except Exception as e:
+            raise RuntimeError(f"Failed to decode {ext.upper()} audio file; ensure ffmpeg is present.\nError: {str(e)}")
+
+    # Fallback to librosa for other formats
+    import librosa
+    samples, sr = librosa.load(filepath, sr=None, mono=False)
+    if samples.ndim == 1:
+        samples = np.expand_dims(samples, axis=0)
+    return samples, sr, None
+
 
 class AudioTrack(QObject):
     """
@@ -51,11 +256,15 @@ class AudioTrack(QObject):
     volumeChanged = pyqtSignal(float)
     trackDeleted = pyqtSignal(object)  # Emits self reference
     
-    def __init__(self, parent=None, track_id=None, name="New Track", color=None):
+    def __init__(self, parent=None, track_id=None, name="New Track", color=None,
+                 create_ui=True):
         super().__init__(parent)
         self.track_id = track_id or str(uuid.uuid4())
         self._name = name
-        self._color = QColor(color or TRACK_COLORS[0])
+        if isinstance(color, QColor):
+            self._color = color
+        else:
+            self._color = QColor(color) if color else TRACK_QCOLORS[0]
         self._muted = False
         self._soloed = False
         self._volume = 1.0  # 0.0 to 1.0
@@ -65,15 +274,56 @@ class AudioTrack(QObject):
         self.sr = None
         self.audio_segment = None
         self.filepath = None
+
+        # Min/max decimation pyramid for waveform display, keyed by
+        # bucket size (samples per bin); rebuilt when audio is set
+        self.minmax_levels = {}
+
+        # Undo bookkeeping: ``version`` advances on every edit and
+        # ``_samples_shared`` marks that an undo snapshot still references
+        # the current ``samples`` array (copy-on-write)
+        self.version = 0
+        self._samples_shared = False
         
-        # UI components
+        # UI components (all None while headless; see ensure_ui)
         self.waveform_canvas = None
         self.track_widget = None
         self.header_widget = None
-        
-        # Initialize UI components
+        self.color_btn = None
+        self.name_edit = None
+        self.mute_btn = None
+        self.solo_btn = None
+        self.volume_slider = None
+        self.delete_btn = None
+
+        # Initialize UI components (deferred for headless tracks so
+        # batch import / offline work never pays for widgets)
+        if create_ui:
+            self._init_ui_components()
+
+    @classmethod
+    def headless(cls, samples, sr, name="New Track", color=None,
+                 audio_segment=None, filepath=None):
+        """
+        Build a track with audio data but no widgets (batch import,
+        offline mixdown). ensure_ui() materializes the UI later.
+        """
+        track = cls(name=name, color=color, create_ui=False)
+        track.set_audio_data(samples, sr, audio_segment, filepath)
+        return track
+
+    def ensure_ui(self):
+        """Create the track's widgets on first need and sync them to
+        the current state; no-op if the UI already exists."""
+        if self.track_widget is not None:
+            return
         self._init_ui_components()
-    
+        if self._muted:
+            self.mute_btn.setChecked(True)
+        if self._soloed:
+            self.solo_btn.setChecked(True)
+        self._refresh_waveform_display()
+
     def _init_ui_components(self):
         """Initialize the track's UI components including waveform and header"""
         # Create waveform canvas
@@ -93,10 +343,7 @@ class AudioTrack(QObject):
         layout.addWidget(self.waveform_canvas)
         
         # Style the track widget
-        self.track_widget.setStyleSheet(f"""
-            QWidget {{ background-color: {DARK_BG}; }}
-            QLabel {{ color: {DARK_FG}; }}
-        """)
+        self.track_widget.setStyleSheet(TRACK_WIDGET_STYLE)
     
     def _create_header_widget(self):
         """Create the track header with name, color, mute, solo, and volume controls"""
@@ -104,30 +351,7 @@ class AudioTrack(QObject):
         header.setFrameShape(QFrame.StyledPanel)
         header.setMaximumHeight(48)
         header.setMinimumHeight(48)
-        header.setStyleSheet(f"""
-            QFrame {{ 
-                background-color: #21242b; 
-                border: 1px solid #31343a; 
-                border-radius: 6px;
-                margin: 2px;
-            }}
-            QToolButton {{
-                background-color: #2a2e36;
-                color: {DARK_FG};
-                border: none;
-                border-radius: 4px;
-                padding: 4px;
-                min-width: 48px;
-                min-height: 48px;
-            }}
-            QToolButton:hover {{
-                background-color: #383c45;
-            }}
-            QToolButton:checked {{
-                background-color: {self._color.name()};
-                color: #000000;
-            }}
-        """)
+        header.setStyleSheet(_header_style(self._color.name()))
         
         layout = QHBoxLayout(header)
         layout.setContentsMargins(4, 4, 4, 4)
@@ -136,13 +360,13 @@ class AudioTrack(QObject):
         # Color selector button
         self.color_btn = QToolButton()
         self.color_btn.setFixedSize(32, 32)
-        self.color_btn.setStyleSheet(f"background-color: {self._color.name()}; border-radius: 16px;")
+        self.color_btn.setStyleSheet(_color_btn_style(self._color.name()))
         self.color_btn.setToolTip("Change track color")
         self.color_btn.clicked.connect(self._show_color_dialog)
         
         # Track name edit
         self.name_edit = QLineEdit(self._name)
-        self.name_edit.setStyleSheet(f"color: {DARK_FG}; background-color: #2a2e36; border: 1px solid #373a42; border-radius: 4px; padding: 4px;")
+        self.name_edit.setStyleSheet(NAME_EDIT_STYLE)
         self.name_edit.editingFinished.connect(self._update_name)
         self.name_edit.setMinimumWidth(150)
         
@@ -183,35 +407,134 @@ class AudioTrack(QObject):
         
         return header
     
+    @staticmethod
+    def _decode_segment(segment):
+        """
+        Decode an AudioSegment into planar float32 samples in one pass.
+
+        np.frombuffer aliases pydub's raw buffer with zero copy;
+        pcm_to_planar_f32 fuses the deinterleave, cast, and scale.
+        """
+        dtype = {1: np.int8, 2: np.int16, 4: np.int32}[segment.sample_width]
+        raw = np.frombuffer(segment.raw_data, dtype=dtype)
+        return pcm_to_planar_f32(raw, segment.channels, segment.sample_width)
+
     def set_audio_data(self, samples, sr, audio_segment=None, filepath=None):
         """Set the audio data for this track and update the waveform display"""
         try:
+            # Decode the segment once up front so playback never has to
+            # slice pydub objects in the audio callback
+            if samples is None and audio_segment is not None:
+                samples = self._decode_segment(audio_segment)
+                sr = audio_segment.frame_rate
+
+            # Canonical layout: C-contiguous float32, channel-major.
+            # The decode paths already produce this, so the check is a
+            # no-op for them; anything else (callers handing in
+            # float64, Fortran-ordered, or int buffers) is converted
+            # here once so the mixer and editing kernels can rely on it
+            if samples is not None and (samples.dtype != np.float32
+                                        or not samples.flags['C_CONTIGUOUS']):
+                samples = np.ascontiguousarray(samples, dtype=np.float32)
+
             self.samples = samples
             self.sr = sr
             self.audio_segment = audio_segment
             self.filepath = filepath
-            
-            if self.waveform_canvas and samples is not None and sr is not None:
-                # For large files, update waveform in a separate thread to avoid UI blocking
-                if samples.size > 1000000:  # If more than 1M samples
-                    self._update_waveform_async(samples, sr)
-                else:
-                    self.waveform_canvas.plot_waveform(samples, sr)
-                self._update_header_info()
-                
+
+            # Track duration (probably) changed; drop the container's cache
+            container = self.parent()
+            if container is not None and hasattr(container,
+                                                 'invalidate_duration_cache'):
+                container.invalidate_duration_cache()
+
+
+            self._refresh_waveform_display()
+
         except Exception as e:
             get_error_handler().log_error(f"Error setting audio data for track {self.name}: {str(e)}")
             raise
-    
+
+    def _refresh_waveform_display(self):
+        """Plot the current samples on the canvas; no-op while headless"""
+        if self.waveform_canvas is None or self.samples is None or self.sr is None:
+            return
+        # The canvas only needs display precision; a scaled int16
+        # copy halves the resident memory and the bandwidth of
+        # every redraw pass
+        display = self._make_display_buffer(self.samples)
+        self._build_minmax_pyramid(display)
+        # For large files, update waveform in a separate thread to avoid UI blocking
+        if display.size > 1000000:  # If more than 1M samples
+            self._update_waveform_async(display, self.sr)
+        else:
+            self.waveform_canvas.plot_waveform(display, self.sr)
+        self._update_header_info()
+
+    @staticmethod
+    def _make_display_buffer(samples):
+        """Return a scaled int16 copy of float samples for display use.
+        The editing buffer stays float32; the canvas normalizes back."""
+        if samples.dtype == np.int16:
+            return samples
+        return (np.clip(samples, -1.0, 1.0) * 32767.0).astype(np.int16)
+
+    def _build_minmax_pyramid(self, samples):
+        """
+        Build the min/max decimation pyramid used for waveform display.
+
+        The finest level comes from one envelope pass over the mono
+        mix; each coarser level folds the previous one, so the whole
+        pyramid costs barely more than a single O(N) scan. Redraws then
+        pick a level instead of rescanning the full sample array.
+        """
+        self.minmax_levels = {}
+        mono = samples.mean(axis=0).astype(
+            samples.dtype) if samples.ndim > 1 else samples
+
+        base = PYRAMID_BUCKETS[0]
+        n_bins = mono.shape[0] // base
+        if n_bins < 2:
+            return
+        mins, maxs = minmax_envelope(mono, n_bins)
+        self.minmax_levels[base] = (mins, maxs)
+
+        prev_bucket = base
+        for bucket in PYRAMID_BUCKETS[1:]:
+            factor = bucket // prev_bucket
+            n_bins = mins.shape[0] // factor
+            if n_bins < 2:
+                break
+            mins = mins[:n_bins * factor].reshape(n_bins, factor).min(axis=1)
+            maxs = maxs[:n_bins * factor].reshape(n_bins, factor).max(axis=1)
+            self.minmax_levels[bucket] = (mins, maxs)
+            prev_bucket = bucket
+
+    def _pick_pyramid_level(self):
+        """Coarsest pyramid level that still gives the canvas enough bins"""
+        candidates = [b for b, (mins, _) in self.minmax_levels.items()
+                      if mins.shape[0] >= DISPLAY_TARGET_BINS]
+        if candidates:
+            return max(candidates)
+        return min(self.minmax_levels)
+
     def _update_waveform_async(self, samples, sr):
         """Update waveform asynchronously for large files"""
         try:
             # Downsample for display if file is very large
-            if samples.size > 5000000:  # If more than 5M samples
-                # Downsample to every 10th sample for display
-                display_samples = samples[::10] if samples.ndim == 1 else samples[:, ::10]
-                display_sr = sr // 10
-                self.waveform_canvas.plot_waveform(display_samples, display_sr)
+            if samples.size > 5000000 and self.minmax_levels:
+                # Draw from the precomputed min/max pyramid: unlike
+                # plain striding this keeps every peak, and the redraw
+                # cost is O(bins), not O(samples)
+                bucket = self._pick_pyramid_level()
+                mins, maxs = self.minmax_levels[bucket]
+                display = np.empty(mins.shape[0] * 2, dtype=mins.dtype)
+                display[0::2] = mins
+                display[1::2] = maxs
+                # Two points per bucket -> 2*sr/bucket effective rate;
+                # must stay a float or the canvas time axis is skewed
+                # whenever bucket doesn't divide 2*sr
+                self.waveform_canvas.plot_waveform(display, 2 * sr / bucket)
             else:
                 self.waveform_canvas.plot_waveform(samples, sr)
         except Exception as e:
@@ -236,7 +559,8 @@ class AudioTrack(QObject):
         if value != self._name:
             self._name = value
             if hasattr(self, 'name_edit') and self.name_edit:
-                self.name_edit.setText(value)
+                with QSignalBlocker(self.name_edit):
+                    self.name_edit.setText(value)
             self.nameChanged.emit(value)
     
     def _update_name(self):
@@ -256,15 +580,15 @@ class AudioTrack(QObject):
         
         if value != self._color:
             self._color = value
-            if hasattr(self, 'color_btn') and self.color_btn:
-                self.color_btn.setStyleSheet(f"background-color: {value.name()}; border-radius: 16px;")
-            
-            # Update mute/solo button colors
-            if hasattr(self, 'mute_btn') and self.mute_btn:
-                self.mute_btn.setStyleSheet(f"QToolButton:checked {{ background-color: {value.name()}; }}")
-            if hasattr(self, 'solo_btn') and self.solo_btn:
-                self.solo_btn.setStyleSheet(f"QToolButton:checked {{ background-color: {value.name()}; }}")
-                
+            if self.color_btn:
+                self.color_btn.setStyleSheet(_color_btn_style(value.name()))
+
+            # One cached stylesheet swap on the header recolors the
+            # checked state of both mute and solo via the cascade,
+            # instead of re-parsing a sheet per button
+            if self.header_widget:
+                self.header_widget.setStyleSheet(_header_style(value.name()))
+
             self.colorChanged.emit(value)
     
     def _show_color_dialog(self):
@@ -281,7 +605,9 @@ class AudioTrack(QObject):
         if value != self._muted:
             self._muted = value
             if hasattr(self, 'mute_btn') and self.mute_btn:
-                self.mute_btn.setChecked(value)
+                with QSignalBlocker(self.mute_btn):
+                    self.mute_btn.setChecked(value)
+            self._sync_container_state()
             self.muteChanged.emit(value)
     
     def _toggle_mute(self):
@@ -296,7 +622,9 @@ class AudioTrack(QObject):
         if value != self._soloed:
             self._soloed = value
             if hasattr(self, 'solo_btn') and self.solo_btn:
-                self.solo_btn.setChecked(value)
+                with QSignalBlocker(self.solo_btn):
+                    self.solo_btn.setChecked(value)
+            self._sync_container_state()
             self.soloChanged.emit(value)
     
     def _toggle_solo(self):
@@ -313,11 +641,24 @@ class AudioTrack(QObject):
         if value != self._volume:
             self._volume = value
             if hasattr(self, 'volume_slider') and self.volume_slider:
-                self.volume_slider.setValue(int(value * 100))
+                # Blocked so the echo (valueChanged -> _update_volume ->
+                # this setter) never fires; the slider still repaints
+                with QSignalBlocker(self.volume_slider):
+                    self.volume_slider.setValue(int(value * 100))
+            self._sync_container_state()
             self.volumeChanged.emit(value)
-    
+
     def _update_volume(self):
         self.volume = self.volume_slider.value() / 100.0
+
+    def _sync_container_state(self):
+        """Write this track's volume/mute/solo straight into the
+        container's state vectors. A plain call instead of a signal hop:
+        the playback producer reads those vectors each block, and a
+        slider drag should reach it without queued signal dispatch."""
+        container = self.parent()
+        if container is not None and hasattr(container, '_update_state_entry'):
+            container._update_state_entry(self)
     
     def _delete_track(self):
         """Handle track deletion request"""
@@ -327,57 +668,65 @@ class AudioTrack(QObject):
         """Check if this track has playable audio data"""
         return (self.samples is not None and self.sr is not None) or self.audio_segment is not None
     
-    def get_mixed_samples(self, start_time=0, duration=None):
+    def get_view(self, start_idx, n_frames):
         """
-        Get audio samples for playback, applying volume and mute settings.
-        Returns None if track is muted or has no audio data.
+        Return a planar view of the sample buffer for mixing.
+
+        Channel-major with mono lifted to (1, n); no copy and no volume
+        multiply — gain is applied while accumulating in the mixer, so
+        slicing a block out of a track allocates nothing. Returns None
+        if the track has no audio data or the range is empty.
         """
-        if self.muted or not self.is_playable():
-            return None, None
-        
-        if self.audio_segment is not None:
-            # Convert start_time from seconds to milliseconds
-            start_ms = int(start_time * 1000)
-            if duration is not None:
-                duration_ms = int(duration * 1000)
-                segment = self.audio_segment[start_ms:start_ms + duration_ms]
-            else:
-                segment = self.audio_segment[start_ms:]
-            
-            # Apply volume
-            if self._volume != 1.0:
-                gain_db = 20 * np.log10(self._volume) if self._volume > 0 else -96.0
-                segment = segment.apply_gain(gain_db)
-            
-            # Convert to numpy array for mixing
-            samples = np.array(segment.get_array_of_samples()).astype(np.float32)
-            if segment.channels > 1:
-                samples = samples.reshape((-1, segment.channels)).T
-            else:
-                samples = samples[None, :]
-            samples = samples / (2 ** (8 * segment.sample_width - 1))
-            
-            return samples, segment.frame_rate
-        
-        elif self.samples is not None and self.sr is not None:
-            # Convert start_time to sample index
-            start_idx = int(start_time * self.sr)
-            if duration is not None:
-                end_idx = min(start_idx + int(duration * self.sr), self.samples.shape[-1])
-            else:
-                end_idx = self.samples.shape[-1]
-            
-            # Extract the samples and apply volume
-            if self.samples.ndim > 1:
-                samples = self.samples[:, start_idx:end_idx].copy()
-            else:
-                samples = self.samples[start_idx:end_idx].copy()
-            
-            samples = samples * self._volume
-            return samples, self.sr
-        
-        return None, None
-    
+        # Tracks restored from a segment alone (e.g. undo) decode it
+        # here once; after that playback is pure array slicing
+        if self.samples is None and self.audio_segment is not None:
+            self.samples = self._decode_segment(self.audio_segment)
+            self.sr = self.audio_segment.frame_rate
+
+        if self.samples is None:
+            return None
+        end_idx = min(start_idx + n_frames, self.samples.shape[-1])
+        if start_idx >= end_idx:
+            return None
+        if self.samples.ndim > 1:
+            return self.samples[:, start_idx:end_idx]
+        return self.samples[None, start_idx:end_idx]
+
+
+    def fade_ramp(self, dur_samp, fade_in=True):
+        """
+        Return a read-only float32 linear fade ramp of the given length.
+        Cached by (length, direction), so repeated fades cost a dict hit.
+
+        Args:
+            dur_samp: Ramp length in samples
+            fade_in: True for a 0->1 ramp, False for a 1->0 ramp
+        """
+        return _fade_curve(dur_samp, fade_in, 'float32')
+
+    def samples_for_write(self):
+        """
+        Return ``self.samples`` as a buffer safe for in-place edits.
+
+        Undo snapshots hold the current array by reference; if one does,
+        clone it first so the snapshot stays intact (copy-on-write).
+        Bumps ``version`` to record the edit.
+        """
+        if self._samples_shared and self.samples is not None:
+            self.samples = self.samples.copy()
+            self._samples_shared = False
+        self.version += 1
+        return self.samples
+
+    def mark_samples_replaced(self):
+        """
+        Record that ``samples`` was rebound to a freshly built array
+        (slice/concat edits); the old array stays owned by any snapshot
+        that references it, so no copy is needed.
+        """
+        self._samples_shared = False
+        self.version += 1
+
     def get_selection(self):
         """Get the current selection range from the waveform canvas"""
         if self.waveform_canvas and self.waveform_canvas.selection:
@@ -408,6 +757,25 @@ class MultiTrackContainer(QWidget):
         super().__init__(parent)
         self.tracks = []  # List of AudioTrack objects
         self.track_widgets = []  # List of track UI containers
+        # Session playback rate; fixed by the first playable track and
+        # enforced at add time so the audio callback never branches on
+        # per-track rates
+        self.target_sr = None
+        # Shadow state vectors (volume/mute/solo per track), written on
+        # state change so the playback path reads contiguous arrays
+        # instead of chasing Python attributes
+        self._vol_vec = np.empty(0, dtype=np.float32)
+        self._mute_vec = np.empty(0, dtype=bool)
+        self._solo_vec = np.empty(0, dtype=bool)
+        # Cached max duration across tracks; None means recompute
+        self._max_duration_cache = None
+        # Coalesced playhead broadcast state (see set_playhead)
+        self._pending_playhead = None
+        self._playhead_flush_scheduled = False
+        # During playback the audio thread only emits this signal; Qt
+        # queues it onto the GUI thread, where set_playhead coalesces
+        # the canvas updates
+        self.playbackPositionChanged.connect(self.set_playhead)
         
         # Playback state
         self.is_playing = False
@@ -440,12 +808,7 @@ class MultiTrackContainer(QWidget):
         self.tracks_scroll.setWidgetResizable(True)
         self.tracks_scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOn)
         self.tracks_scroll.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-        self.tracks_scroll.setStyleSheet(f"""
-            QScrollArea {{ background: {DARK_BG}; border: none; }}
-            QScrollBar {{ background: #21242b; width: 16px; height: 16px; }}
-            QScrollBar::handle {{ background: #3a3f4b; border-radius: 5px; }}
-            QScrollBar::handle:hover {{ background: #474d5d; }}
-        """)
+        self.tracks_scroll.setStyleSheet(SCROLL_AREA_STYLE)
         
         # Container for all tracks
         self.tracks_container = QWidget()
@@ -471,12 +834,7 @@ class MultiTrackContainer(QWidget):
         ruler.setMinimumHeight(30)
         ruler.setMaximumHeight(30)
         ruler.setFrameShape(QFrame.StyledPanel)
-        ruler.setStyleSheet(f"""
-            QFrame {{ 
-                background-color: #1a1d23; 
-                border-bottom: 1px solid #31343a; 
-            }}
-        """)
+        ruler.setStyleSheet(TIME_RULER_STYLE)
         
         # The actual time markers will be drawn using paintEvent when implemented
         # For now, we'll use a placeholder
@@ -493,24 +851,7 @@ class MultiTrackContainer(QWidget):
         controls = QFrame()
         controls.setMaximumHeight(48)
         controls.setFrameShape(QFrame.StyledPanel)
-        controls.setStyleSheet(f"""
-            QFrame {{ 
-                background-color: #1e2128; 
-                border-top: 1px solid #31343a; 
-            }}
-            QPushButton {{ 
-                background-color: #2a2e36;
-                color: {DARK_FG};
-                border: none;
-                border-radius: 6px;
-                padding: 8px 16px;
-                font-weight: bold;
-                min-height: 36px;
-            }}
-            QPushButton:hover {{ 
-                background-color: #383c45;
-            }}
-        """)
+        controls.setStyleSheet(TRACK_CONTROLS_STYLE)
         
         layout = QHBoxLayout(controls)
         layout.setContentsMargins(8, 4, 8, 4)
@@ -536,28 +877,7 @@ class MultiTrackContainer(QWidget):
         controls = QFrame()
         controls.setMaximumHeight(60)
         controls.setFrameShape(QFrame.StyledPanel)
-        controls.setStyleSheet(f"""
-            QFrame {{ 
-                background-color: #21242b; 
-                border-top: 1px solid #31343a; 
-            }}
-            QToolButton {{ 
-                background-color: #2a2e36;
-                color: {DARK_FG};
-                border: none;
-                border-radius: 6px;
-                padding: 8px;
-                min-width: 48px;
-                min-height: 48px;
-            }}
-            QToolButton:hover {{ 
-                background-color: #383c45;
-            }}
-            QToolButton:checked {{ 
-                background-color: {ACCENT_COLOR};
-                color: #000000;
-            }}
-        """)
+        controls.setStyleSheet(PLAYBACK_CONTROLS_STYLE)
         
         layout = QHBoxLayout(controls)
         layout.setContentsMargins(8, 4, 8, 4)
@@ -586,14 +906,7 @@ class MultiTrackContainer(QWidget):
         
         # Current time display
         self.time_display = QLabel("00:00.000")
-        self.time_display.setStyleSheet(f"""
-            color: {DARK_FG}; 
-            font-family: monospace; 
-            font-size: 16px; 
-            background-color: #1a1d23; 
-            padding: 4px 8px; 
-            border-radius: 4px;
-        """)
+        self.time_display.setStyleSheet(TIME_DISPLAY_STYLE)
         
         # Add widgets to layout
         layout.addWidget(self.rewind_btn)
@@ -608,23 +921,71 @@ class MultiTrackContainer(QWidget):
     def add_empty_track(self):
         """Add a new empty track to the container"""
         # Create a new track with a color from the TRACK_COLORS list
-        track_color = TRACK_COLORS[len(self.tracks) % len(TRACK_COLORS)]
+        track_color = TRACK_QCOLORS[len(self.tracks) % len(TRACK_QCOLORS)]
         track = AudioTrack(self, name=f"Track {len(self.tracks) + 1}", color=track_color)
         return self._add_track(track)
     
+    @staticmethod
+    def _resample_track(track, target_sr):
+        """
+        Resample a track's samples to target_sr once, at load time.
+
+        soxr's polyphase band-limited sinc resampler (C + SIMD) when
+        installed, FFT-domain scipy.signal.resample otherwise; either
+        way the cost is paid here so the realtime audio path never
+        resamples per block.
+        """
+        if track.samples is None or not track.sr or track.sr == target_sr:
+            return
+        was_1d = track.samples.ndim == 1
+        samples = track.samples[None, :] if was_1d else track.samples
+        if soxr is not None:
+            # soxr wants (frames, channels)
+            resampled = np.ascontiguousarray(
+                soxr.resample(samples.T, track.sr, target_sr).T,
+                dtype=np.float32)
+        else:
+            n_out = int(round(samples.shape[-1] * target_sr / track.sr))
+            resampled = np.ascontiguousarray(
+                signal.resample(samples, n_out, axis=-1), dtype=np.float32)
+        track.samples = resampled[0] if was_1d else resampled
+        track.sr = target_sr
+        # The segment still holds PCM at the old rate; drop it so
+        # nothing replays stale audio
+        track.audio_segment = None
+        track.mark_samples_replaced()
+
     def _add_track(self, track):
         """Internal method to add a track to the container"""
-        # Connect track signals
+        # Headless tracks (batch import) get their widgets only now,
+        # when they are actually about to be shown
+        if track.parent() is None:
+            track.setParent(self)
+        track.ensure_ui()
+
+        # Resample to the session playback rate up front (the first
+        # playable track sets it) so the audio callback never resamples
+        if track.sr:
+            if self.target_sr is None:
+                self.target_sr = track.sr
+            elif track.sr != self.target_sr:
+                self._resample_track(track, self.target_sr)
+
+        # Connect track signals. Volume/mute/solo reach the state
+        # vectors directly from the property setters (see
+        # _sync_container_state); the signals stay for UI consumers.
         track.trackDeleted.connect(self.remove_track)
-        
+
         # Add track to list and UI
         self.tracks.append(track)
+        self._rebuild_state_vectors()
         
         # Add track widget to the layout (before the stretch)
         self.tracks_layout.insertWidget(self.tracks_layout.count() - 1, track.track_widget)
         self.track_widgets.append(track.track_widget)
         
         # Emit signal
+        self.invalidate_duration_cache()
         self.trackAdded.emit(track)
         return track
     
@@ -639,8 +1000,10 @@ class MultiTrackContainer(QWidget):
             
             # Remove track from list
             self.tracks.remove(track)
-            
+            self._rebuild_state_vectors()
+
             # Emit signal
+            self.invalidate_duration_cache()
             self.trackRemoved.emit(track)
             
             # Clean up track resources
@@ -653,6 +1016,23 @@ class MultiTrackContainer(QWidget):
         for track in tracks_copy:
             self.remove_track(track)
     
+    def _rebuild_state_vectors(self):
+        """Rebuild the volume/mute/solo shadow vectors from the tracks"""
+        self._vol_vec = np.array([t._volume for t in self.tracks],
+                                 dtype=np.float32)
+        self._mute_vec = np.array([t._muted for t in self.tracks], dtype=bool)
+        self._solo_vec = np.array([t._soloed for t in self.tracks], dtype=bool)
+
+    def _update_state_entry(self, track):
+        """Write one track's state into the shadow vectors (O(1) writes)"""
+        try:
+            i = self.tracks.index(track)
+        except ValueError:
+            return
+        self._vol_vec[i] = track._volume
+        self._mute_vec[i] = track._muted
+        self._solo_vec[i] = track._soloed
+
     def get_track_by_id(self, track_id):
         """Get a track by its ID"""
         for track in self.tracks:
@@ -675,7 +1055,7 @@ class MultiTrackContainer(QWidget):
         try:
             # Create a new track with the file basename as the track name
             basename = os.path.basename(filepath)
-            track_color = TRACK_COLORS[len(self.tracks) % len(TRACK_COLORS)]
+            track_color = TRACK_QCOLORS[len(self.tracks) % len(TRACK_QCOLORS)]
             track = AudioTrack(self, name=basename, color=track_color)
             
             # Try to load the audio file
@@ -692,38 +1072,54 @@ class MultiTrackContainer(QWidget):
     
     def _load_audio_file(self, track, filepath):
         """Load an audio file into a track using the appropriate loader"""
-        ext = os.path.splitext(filepath)[1][1:].lower()
-        
-        # Try pydub first for supported formats
-        if ext in ['mp3', 'flac', 'wav', 'aac']:
+        samples, sr, segment = _decode_audio_file(filepath)
+        track.set_audio_data(samples, sr, segment, filepath)
+
+    def load_audio_to_new_tracks(self, filepaths):
+        """
+        Import several audio files at once, each into a new track.
+
+        Decoding (pydub/ffmpeg or librosa) runs in parallel on a thread
+        pool; only track/widget creation happens afterwards on the GUI
+        thread. Returns the list of tracks that imported successfully.
+        """
+        if not filepaths:
+            return []
+
+        def decode(path):
+            # Errors are returned, not raised, so one bad file doesn't
+            # abort the whole batch
             try:
-                if ext == 'aac':
-                    audio = AudioSegment.from_file(filepath, 'aac')
-                else:
-                    audio = AudioSegment.from_file(filepath)
-                    
-                # Convert to numpy array
-                samples = np.array(audio.get_array_of_samples()).astype(np.float32)
-                if audio.channels > 1:
-                    samples = samples.reshape((-1, audio.channels)).T
-                samples = samples / (2 ** (8 * audio.sample_width - 1))
-                
-                # Set track data
-                track.set_audio_data(samples, audio.frame_rate, audio, filepath)
-                return
-                
+                return _decode_audio_file(path)
             except Exception as e:
-                raise RuntimeError(f"Failed to decode {ext.upper()} audio file; ensure ffmpeg is present.\nError: {str(e)}")
-                
-        # Fallback to librosa for other formats
-        import librosa
-        samples, sr = librosa.load(filepath, sr=None, mono=False)
-        if samples.ndim == 1:
-            samples = np.expand_dims(samples, axis=0)
-            
-        # Set track data
-        track.set_audio_data(samples, sr, None, filepath)
-        
+                return e
+
+        workers = min(len(filepaths), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(decode, filepaths))
+
+        tracks = []
+        errors = []
+        for filepath, result in zip(filepaths, results):
+            if isinstance(result, Exception):
+                errors.append(f"{os.path.basename(filepath)}: {result}")
+                continue
+            samples, sr, segment = result
+            basename = os.path.basename(filepath)
+            track_color = TRACK_QCOLORS[len(self.tracks) % len(TRACK_QCOLORS)]
+            track = AudioTrack.headless(samples, sr, name=basename,
+                                        color=track_color,
+                                        audio_segment=segment,
+                                        filepath=filepath)
+            self._add_track(track)
+            tracks.append(track)
+
+        if errors:
+            QMessageBox.critical(
+                self, "Import Error",
+                "Could not import:\n" + "\n".join(errors))
+        return tracks
+
     # --- Playback Methods ---
     def play(self, start_position=None):
         """Start playback from the given position or current position"""
@@ -784,93 +1180,166 @@ class MultiTrackContainer(QWidget):
             return
             
         try:
-            # Get information about tracks to play
-            active_tracks = [t for t in self.tracks if not t.muted and t.is_playable()]
+            # Select the tracks to play from the shadow state vectors
+            playable = np.fromiter((t.is_playable() for t in self.tracks),
+                                   dtype=bool, count=len(self.tracks))
+            active_mask = ~self._mute_vec & playable
+            if (self._solo_vec & active_mask).any():
+                active_mask &= self._solo_vec
+            active_tracks = [t for t, a in zip(self.tracks, active_mask) if a]
             if not active_tracks:
                 return
-                
-            # Find if any track is soloed
-            has_solo = any(t.soloed for t in active_tracks)
-            if has_solo:
-                active_tracks = [t for t in active_tracks if t.soloed]
-            
-            # Determine sample rate to use (use highest among tracks)
-            sr = max(t.sr for t in active_tracks if t.sr is not None)
             
-            # Setup sounddevice callback for streaming audio
+            # Session playback rate; derive it once from the tracks if
+            # audio was attached after the tracks were added
+            sr = self.target_sr
+            if sr is None:
+                sr = max(t.sr for t in active_tracks if t.sr is not None)
+                self.target_sr = sr
+
+            # Tracks already at the stream rate mix through one fused
+            # kernel pass; rate-mismatched tracks keep the resampling
+            # path. Sources are packed once here, not per callback.
+            kernel_tracks = [
+                t for t in active_tracks
+                if t.samples is not None and t.sr == sr
+                and t.samples.dtype == np.float32
+            ]
+            slow_tracks = [t for t in active_tracks if t not in kernel_tracks]
+            sources = make_source_list([
+                t.samples if t.samples.ndim > 1 else t.samples[None, :]
+                for t in kernel_tracks
+            ])
+            kernel_idx = np.array(
+                [self.tracks.index(t) for t in kernel_tracks], dtype=np.intp)
+            volumes = np.empty(len(kernel_tracks), dtype=np.float32)
+
+            # Ring of premixed blocks: a producer thread runs the DSP
+            # ahead of time and the realtime callback only copies one
+            # slot out. Single producer / single consumer, so the two
+            # counters need no lock (Python int writes are atomic)
+            blocksize = 1024
+            n_slots = 8
+            ring = np.zeros((n_slots, 2, blocksize), dtype=np.float32)
+            ring_pos = np.zeros(n_slots)  # End position (s) of each block
+            write_counter = 0
+            read_counter = 0
+            space_free = threading.Event()
+            # (up, down) rational ratios per source rate for the rare
+            # off-rate slow tracks, computed once per session
+            ratio_cache = {}
+
+            def produce_block(out, position):
+                """Mix one block starting at `position` (seconds) into out"""
+                duration = blocksize / sr
+
+                if kernel_tracks:
+                    start_idx = int(position * sr)
+                    # Volumes gathered from the shadow vector each
+                    # block so slider moves apply; no attribute chasing
+                    np.take(self._vol_vec, kernel_idx, out=volumes)
+                    mix_block(out, sources, volumes, start_idx)
+                else:
+                    out.fill(0.0)
+
+                for track in slow_tracks:
+                    if track.samples is None:
+                        # Forces the one-time segment decode
+                        if track.get_view(0, 1) is None:
+                            continue
+                    track_sr = track.sr
+                    view = track.get_view(int(position * track_sr),
+                                          int(duration * track_sr))
+                    if view is None:
+                        continue
+
+                    # Resample if needed: polyphase at the rational
+                    # ratio (e.g. 48000->44100 is 147:160), O(N*taps)
+                    # with no per-block FFT
+                    if track_sr != sr:
+                        ratio = ratio_cache.get(track_sr)
+                        if ratio is None:
+                            g = math.gcd(int(sr), int(track_sr))
+                            ratio = (int(sr) // g, int(track_sr) // g)
+                            ratio_cache[track_sr] = ratio
+                        track_samples = signal.resample_poly(
+                            view, ratio[0], ratio[1], axis=1)
+                    else:
+                        track_samples = view
+
+                    # Accumulate with gain fused in; a short tail past
+                    # the end of the track is implicit silence
+                    n = min(blocksize, track_samples.shape[1])
+                    vol = track.volume
+                    channels = track_samples.shape[0]
+                    out[0, :n] += track_samples[0, :n] * vol
+                    out[1, :n] += track_samples[min(1, channels - 1), :n] * vol
+
+                # Global volume and the clipping guard fused into one
+                # pass: a single peak scan, then at most one in-place
+                # multiply over the block
+                scale = self.global_volume
+                peak = float(np.max(np.abs(out))) * scale
+                if peak > 1.0:
+                    scale /= peak
+                if scale != 1.0:
+                    np.multiply(out, scale, out=out)
+
+            def producer():
+                nonlocal write_counter
+                position = self.playback_position
+                while self.is_playing:
+                    if write_counter - read_counter >= n_slots:
+                        # Ring full; sleep until the callback frees a slot
+                        space_free.wait(0.05)
+                        space_free.clear()
+                        continue
+                    slot = write_counter % n_slots
+                    produce_block(ring[slot], position)
+                    position += blocksize / sr
+                    ring_pos[slot] = position
+                    write_counter += 1
+
+            # The realtime callback: copy one premixed slot and advance.
+            # All per-track DSP stays on the producer thread.
             def audio_callback(outdata, frames, time, status):
+                nonlocal read_counter
                 if not self.is_playing:
                     # Fill with zeros and stop stream
                     outdata.fill(0)
                     self.playback_stream.stop()
                     return
-                    
-                # Calculate what portion of each track to play
-                duration = frames / sr
-                
-                # Mix all active tracks
-                mixed_samples = np.zeros((2, frames))  # Stereo output
-                
-                for track in active_tracks:
-                    track_samples, track_sr = track.get_mixed_samples(
-                        start_time=self.playback_position,
-                        duration=duration
-                    )
-                    
-                    if track_samples is not None:
-                        # Resample if needed
-                        if track_sr != sr:
-                            # Simple resampling - for proper implementation use a resampling library
-                            ratio = sr / track_sr
-                            new_len = int(track_samples.shape[1] * ratio)
-                            from scipy import signal
-                            track_samples = signal.resample(track_samples, new_len, axis=1)
-                            
-                        # Ensure correct length
-                        if track_samples.shape[1] < frames:
-                            # Pad with zeros
-                            pad_width = frames - track_samples.shape[1]
-                            track_samples = np.pad(track_samples, ((0, 0), (0, pad_width)))
-                        elif track_samples.shape[1] > frames:
-                            # Trim excess
-                            track_samples = track_samples[:, :frames]
-                            
-                        # Mix into output with track volume
-                        channels = track_samples.shape[0]
-                        if channels == 1:
-                            # Mono to stereo
-                            mixed_samples[0] += track_samples[0]
-                            mixed_samples[1] += track_samples[0]
-                        else:
-                            # Use first two channels (or duplicate if only one)
-                            mixed_samples[0] += track_samples[0]
-                            mixed_samples[1] += track_samples[min(1, channels-1)]
-                
-                # Apply global volume
-                mixed_samples *= self.global_volume
-                
-                # Prevent clipping
-                if np.max(np.abs(mixed_samples)) > 1.0:
-                    mixed_samples /= np.max(np.abs(mixed_samples))
-                
-                # Update output buffer (convert to float32 non-interleaved format)
-                outdata[:] = mixed_samples.T.astype(np.float32)
-                
-                # Update playback position and emit signal
-                self.playback_position += duration
+
+                if write_counter == read_counter or frames != blocksize:
+                    # Underrun (or an odd host block size): emit silence
+                    # rather than blocking the audio thread
+                    outdata.fill(0)
+                    return
+
+                slot = read_counter % n_slots
+                outdata[:] = ring[slot].T
+                self.playback_position = ring_pos[slot]
+                read_counter += 1
+                space_free.set()
+
+                # The queued connection to set_playhead repaints the
+                # track canvases from the GUI thread; nothing here may
+                # touch widgets
                 self.playbackPositionChanged.emit(self.playback_position)
-                
-                # Update playhead in each track
-                for track in self.tracks:
-                    if track.waveform_canvas:
-                        track.waveform_canvas.update_playhead(self.playback_position)
-            
+
+            # Let the producer premix a few blocks before audio starts
+            producer_thread = threading.Thread(target=producer, daemon=True)
+            producer_thread.start()
+            deadline = time.time() + 0.25
+            while write_counter < 2 and time.time() < deadline:
+                time.sleep(0.002)
+
             # Start the sounddevice stream
             self.playback_stream = sd.OutputStream(
                 samplerate=sr,
                 channels=2,
                 callback=audio_callback,
-                blocksize=1024,
+                blocksize=blocksize,
                 dtype='float32'
             )
             
@@ -893,12 +1362,46 @@ class MultiTrackContainer(QWidget):
         # Emit signal
         self.selectionChanged.emit(start, end)
         
+    def set_playhead(self, position):
+        """
+        Move every track's playhead to the given position (seconds).
+
+        Repeated calls within one event-loop turn coalesce: only the
+        latest position is painted, in a single walk over the tracks,
+        so scrubbing emits one redraw per frame instead of one per call
+        per track.
+        """
+        self._pending_playhead = position
+        if not self._playhead_flush_scheduled:
+            self._playhead_flush_scheduled = True
+            QTimer.singleShot(0, self._flush_playhead)
+
+    def _flush_playhead(self):
+        """Paint the most recent pending playhead position on all tracks"""
+        self._playhead_flush_scheduled = False
+        position = self._pending_playhead
+        if position is None:
+            return
+        for track in self.tracks:
+            if track.waveform_canvas:
+                track.waveform_canvas.update_playhead(position)
+
+    def invalidate_duration_cache(self):
+        """Force the next get_max_duration call to rescan the tracks"""
+        self._max_duration_cache = None
+
     def get_max_duration(self):
-        """Get the maximum duration across all tracks"""
+        """
+        Get the maximum duration across all tracks.
+        Cached; the O(tracks) scan reruns only after a track is added,
+        removed, or has its audio replaced.
+        """
         if not self.tracks:
             return 0.0
-            
-        return max(
-            (t.waveform_canvas.max_time if t.waveform_canvas else 0.0)
-            for t in self.tracks
-        )
+
+        if self._max_duration_cache is None:
+            self._max_duration_cache = max(
+                (t.waveform_canvas.max_time if t.waveform_canvas else 0.0)
+                for t in self.tracks
+            )
+        return self._max_duration_cache
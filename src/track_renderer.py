@@ -1,9 +1,11 @@
 import numpy as np
 import matplotlib
+matplotlib.use('Qt5Agg')  # Must be selected before importing pyplot
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+from matplotlib.collections import LineCollection
 
-from PyQt5.QtCore import Qt, pyqtSignal, QObject, QEvent
+from PyQt5.QtCore import Qt, pyqtSignal, QObject, QEvent, QTimer
 from PyQt5.QtGui import QColor, QPalette
 from PyQt5.QtWidgets import QSizePolicy
 
@@ -16,6 +18,26 @@ GRID_COLOR = '#31343a'
 SELECTION_COLOR = '#ffc14d'
 
 
+def _minmax_columns(y_min, y_max, n_cols):
+    """
+    Decimate per-sample (or per-bin) min/max arrays to min/max per pixel
+    column, interleaved so the drawn polyline still passes through every
+    extreme. Pass the same array twice for raw samples.
+
+    Returns (offsets, values): ``offsets`` are fractional column centers
+    in input-index units (each repeated for its min/max pair) and
+    ``values`` is the interleaved 2*n_cols array.
+    """
+    idx = np.linspace(0, y_min.shape[0], n_cols + 1).astype(np.intp)
+    mins = np.minimum.reduceat(y_min, idx[:-1])
+    maxs = np.maximum.reduceat(y_max, idx[:-1])
+    values = np.empty(n_cols * 2, dtype=y_min.dtype)
+    values[0::2] = mins
+    values[1::2] = maxs
+    centers = (idx[:-1] + idx[1:]) * 0.5
+    return np.repeat(centers, 2), values
+
+
 class EnhancedWaveformCanvas(FigureCanvas):
     """
     Enhanced waveform display with scrubbing support, time grid, and advanced visualization.
@@ -64,6 +86,20 @@ class EnhancedWaveformCanvas(FigureCanvas):
         self.amplitude_label = None
         self.samples = None  # Cached audio data
         self.sr = None  # Sample rate
+        self._samples_mono = None  # Normalized mono mix for drawing
+        self._n_samples = 0  # len(self._samples_mono), cached for hot paths
+        self._waveform_line = None  # Persistent waveform Line2D
+        self._mips = []  # Min/max mipmap cascade (see _build_mips)
+        self._bg = None  # Cached clean background for blitting
+
+        # Coalesce hover-cursor redraws: high-polling-rate mice deliver
+        # far more move events than the display can show, so only the
+        # latest position is drawn, at most ~60 times a second
+        self._pending_cursor_event = None
+        self._cursor_timer = QTimer(self)
+        self._cursor_timer.setSingleShot(True)
+        self._cursor_timer.setInterval(16)
+        self._cursor_timer.timeout.connect(self._flush_cursor)
         
         # Connect mouse and key events
         self.mpl_connect("button_press_event", self.on_mouse_press)
@@ -71,6 +107,9 @@ class EnhancedWaveformCanvas(FigureCanvas):
         self.mpl_connect("button_release_event", self.on_mouse_release)
         self.mpl_connect("scroll_event", self.on_scroll)
         self.mpl_connect("key_press_event", self.on_key_press)
+        # Recapture the blit background whenever the figure is fully
+        # rasterized (covers Qt-driven draws like resizes too)
+        self.mpl_connect("draw_event", self._on_draw)
         
         # Store color theme
         self.waveform_color = ACCENT_COLOR
@@ -82,6 +121,38 @@ class EnhancedWaveformCanvas(FigureCanvas):
         self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         self.setMinimumHeight(120)
         
+    def _on_draw(self, event):
+        """Cache the freshly rasterized background for blitting.
+
+        The playhead and live cursor are animated artists, so they are
+        excluded from normal draws and the cached region is always the
+        clean waveform + grid."""
+        self._bg = self.copy_from_bbox(self.ax.bbox)
+
+    def _full_draw(self):
+        """Rasterize the whole figure, then paint the overlay on top"""
+        self.draw()
+        self._blit_overlay()
+
+    def _blit_overlay(self):
+        """Restore the cached background and draw only the animated
+        overlay artists (playhead, live cursor). This skips the full
+        figure rasterize, which is what makes scrubbing and playhead
+        ticks cheap."""
+        if self._bg is None:
+            self.draw()
+            if self._bg is None:
+                return
+        self.restore_region(self._bg)
+        if self.playhead_line is not None:
+            self.ax.draw_artist(self.playhead_line)
+        if (self.live_cursor_line is not None
+                and self.live_cursor_line.get_visible()):
+            self.ax.draw_artist(self.live_cursor_line)
+            if self.live_cursor_text is not None:
+                self.ax.draw_artist(self.live_cursor_text)
+        self.blit(self.ax.bbox)
+
     def _style_axes(self):
         """Apply visual styling to the axes for a modern dark theme"""
         self.ax.set_facecolor(DARK_BG)
@@ -115,26 +186,39 @@ class EnhancedWaveformCanvas(FigureCanvas):
         if color:
             self.waveform_color = color
         
-        # Clear the plot but keep axis settings
-        self.ax.clear()
-        self._style_axes()
-        
+        # No ax.clear(): clear-and-replot is the slowest Matplotlib
+        # path. The waveform line is mutated in place, grid and
+        # selection drawing remove their own artists, and the overlay
+        # (playhead, cursor) persists across replots.
+
         # Calculate time array and max time
         if samples.ndim > 1:
             samples_mono = samples.mean(axis=0)
         else:
             samples_mono = samples
-            
-        t = np.linspace(0, len(samples_mono) / sr, num=len(samples_mono))
-        self.max_time = t[-1] if len(t) > 0 else 1
-        
+
+        # int16 display buffers are scaled by 32767; normalize for drawing
+        if samples.dtype == np.int16:
+            samples_mono = samples_mono * (1.0 / 32767.0)
+
+        # Canonical form for everything downstream (drawing, mips,
+        # cursor readout): contiguous float32, already normalized, so
+        # the per-event paths carry no dtype or ndim branches
+        self._samples_mono = np.ascontiguousarray(
+            samples_mono, dtype=np.float32)
+        self._n_samples = self._samples_mono.shape[0]
+        self._build_mips(self._samples_mono)
+        self.max_time = len(samples_mono) / sr if len(samples_mono) > 0 else 1
+
         # Set reasonable default view if current view is invalid
         if self._xmax <= self._xmin or self._xmax > self.max_time:
             self._xmin, self._xmax = 0, min(30, self.max_time)  # Show first 30 seconds by default
-        
-        # Plot the waveform with the specified color
-        self.ax.plot(t, samples_mono, color=self.waveform_color, linewidth=0.8)
-        
+
+        # Plot the visible window of the waveform, decimated to the
+        # pixel grid (a polyline through per-column min/max renders
+        # identically to the full sample set)
+        self._plot_visible()
+
         # Set axis limits and labels
         self.ax.set_xlim([self._xmin, self._xmax])
         self.ax.set_ylim([-1.05, 1.05])
@@ -149,17 +233,79 @@ class EnhancedWaveformCanvas(FigureCanvas):
         
         # Draw playhead
         self._draw_playhead()
-        
-        # Remove any existing cursor displays
-        if self.live_cursor_line is not None:
-            self.live_cursor_line.remove()
-            self.live_cursor_line = None
-        if self.live_cursor_text is not None:
-            self.live_cursor_text.remove()
-            self.live_cursor_text = None
-            
-        self.draw()
-        
+
+        self._full_draw()
+
+    def _build_mips(self, samples_mono):
+        """
+        Build the min/max mipmap cascade for the mono waveform.
+
+        Level L holds per-bin extremes at decimation 2**(L+1); each
+        level folds the previous one by pairwise min/max, so the whole
+        cascade is one O(N) pass and O(N) extra memory in total. Zoom
+        redraws then read the level closest to the pixel grid instead
+        of rescanning raw samples.
+        """
+        self._mips = []
+        s_min = s_max = samples_mono
+        while s_min.shape[0] > 2048:
+            n = s_min.shape[0] // 2
+            s_min = np.minimum(s_min[0:2 * n:2], s_min[1:2 * n:2])
+            s_max = np.maximum(s_max[0:2 * n:2], s_max[1:2 * n:2])
+            self._mips.append((s_min, s_max))
+
+    def _plot_visible(self):
+        """
+        (Re)plot the mono waveform for the current view window.
+
+        Only the visible range is handed to Matplotlib, decimated to a
+        few points per pixel column via the mipmap cascade, so both the
+        decimation work and the rendered vertex count are O(canvas
+        width) regardless of track length or zoom level. The line
+        artist persists across view changes; set_data mutates it.
+        """
+        y = self._samples_mono
+        if y is None or self.sr is None:
+            return
+
+        i0 = max(0, int(self._xmin * self.sr))
+        i1 = min(y.shape[0], int(np.ceil(self._xmax * self.sr)) + 1)
+        if i1 - i0 < 2:
+            t, values = np.empty(0), np.empty(0)
+        else:
+            n_cols = max(100, int(self.fig.get_size_inches()[0] * self.fig.dpi))
+
+            # Coarsest mip level that still gives ~4 input bins per
+            # pixel column; level -1 means raw samples
+            level = -1
+            n_visible = i1 - i0
+            while (level + 1 < len(self._mips)
+                   and (n_visible >> (level + 2)) >= 4 * n_cols):
+                level += 1
+
+            if level >= 0:
+                step = 1 << (level + 1)
+                mip_min, mip_max = self._mips[level]
+                j0 = i0 // step
+                j1 = min(mip_min.shape[0], -(-i1 // step))
+                offsets, values = _minmax_columns(
+                    mip_min[j0:j1], mip_max[j0:j1], n_cols)
+                t = (j0 + offsets) * step / self.sr
+            elif n_visible > 4 * n_cols:
+                window = y[i0:i1]
+                offsets, values = _minmax_columns(window, window, n_cols)
+                t = (i0 + offsets) / self.sr
+            else:
+                values = y[i0:i1]
+                t = np.arange(i0, i1) / self.sr
+
+        if self._waveform_line is None:
+            self._waveform_line, = self.ax.plot(
+                t, values, color=self.waveform_color, linewidth=0.8)
+        else:
+            self._waveform_line.set_data(t, values)
+            self._waveform_line.set_color(self.waveform_color)
+
     def _draw_time_grid(self):
         """Draw adaptive time grid with time markers based on zoom level"""
         # Clear existing grid lines and markers
@@ -204,59 +350,67 @@ class EnhancedWaveformCanvas(FigureCanvas):
         # Get rounded start and end times for grid
         start_time = int(self._xmin / grid_step) * grid_step
         end_time = int(self._xmax / grid_step + 1) * grid_step
-        
-        # Draw vertical grid lines
-        current_time = start_time
-        while current_time <= end_time:
-            # Skip if outside view
-            if current_time < 0:
-                current_time += grid_step
+
+        # All tick positions at once; two LineCollections (major/minor)
+        # replace one Line2D artist per gridline, so wide zoom-outs add
+        # two artists instead of hundreds
+        ticks = np.arange(start_time, end_time + grid_step / 2, grid_step)
+        ticks = ticks[ticks >= 0]
+        if ticks.size == 0:
+            return
+        mod = ticks % major_step
+        major_mask = (mod < 0.001) | (np.abs(mod - major_step) < 0.001)
+
+        for mask, style, width, alpha in (
+                (major_mask, '-', 0.8, 0.6),
+                (~major_mask, ':', 0.5, 0.3)):
+            xs = ticks[mask]
+            if xs.size == 0:
                 continue
-                
-            # Determine if this is a major grid line
-            is_major = (current_time % major_step) < 0.001 or abs(current_time % major_step - major_step) < 0.001
-            
-            # Draw the grid line with appropriate style
-            line = self.ax.axvline(
-                current_time, 
-                color=self.grid_color,
-                linestyle='-' if is_major else ':',
-                linewidth=0.8 if is_major else 0.5,
-                alpha=0.6 if is_major else 0.3,
+            segments = np.empty((xs.size, 2, 2))
+            segments[:, 0, 0] = xs
+            segments[:, 1, 0] = xs
+            segments[:, 0, 1] = -1.05
+            segments[:, 1, 1] = 1.05
+            collection = LineCollection(
+                segments,
+                colors=self.grid_color,
+                linestyles=style,
+                linewidths=width,
+                alpha=alpha,
                 zorder=-1
             )
-            self.grid_lines.append(line)
-            
-            # Add time marker text (only for major grid lines)
-            if is_major and current_time >= 0:
-                # Format time based on value
-                if current_time >= 3600:  # >= 1 hour
-                    time_str = f"{int(current_time/3600):02d}:{int((current_time%3600)/60):02d}:{int(current_time%60):02d}"
-                elif current_time >= 60:  # >= 1 minute
-                    time_str = f"{int(current_time/60):d}:{int(current_time%60):02d}"
-                else:  # < 1 minute
-                    time_str = f"{current_time:.1f}s" if grid_step < 1 else f"{int(current_time):d}s"
-                    
-                text = self.ax.text(
-                    current_time, 
-                    0.98,  # Position at top of y-axis
-                    time_str,
-                    fontsize=8,
-                    color=DARK_FG,
-                    alpha=0.8,
-                    va='top',
-                    ha='center',
-                    bbox=dict(
-                        boxstyle="round,pad=0.2",
-                        facecolor=DARK_BG,
-                        alpha=0.7,
-                        edgecolor=self.grid_color,
-                        linewidth=0.5
-                    )
+            self.ax.add_collection(collection)
+            self.grid_lines.append(collection)
+
+        # Time marker text only for the (much smaller) major tick set
+        for current_time in ticks[major_mask]:
+            # Format time based on value
+            if current_time >= 3600:  # >= 1 hour
+                time_str = f"{int(current_time/3600):02d}:{int((current_time%3600)/60):02d}:{int(current_time%60):02d}"
+            elif current_time >= 60:  # >= 1 minute
+                time_str = f"{int(current_time/60):d}:{int(current_time%60):02d}"
+            else:  # < 1 minute
+                time_str = f"{current_time:.1f}s" if grid_step < 1 else f"{int(current_time):d}s"
+
+            text = self.ax.text(
+                current_time,
+                0.98,  # Position at top of y-axis
+                time_str,
+                fontsize=8,
+                color=DARK_FG,
+                alpha=0.8,
+                va='top',
+                ha='center',
+                bbox=dict(
+                    boxstyle="round,pad=0.2",
+                    facecolor=DARK_BG,
+                    alpha=0.7,
+                    edgecolor=self.grid_color,
+                    linewidth=0.5
                 )
-                self.time_markers.append(text)
-                
-            current_time += grid_step
+            )
+            self.time_markers.append(text)
     
     def _draw_selection(self):
         """Draw the audio selection region"""
@@ -327,34 +481,34 @@ class EnhancedWaveformCanvas(FigureCanvas):
                 self._sel_patch.append(text)
     
     def _draw_playhead(self):
-        """Draw the playhead indicator line"""
-        # Remove previous playhead
-        if self.playhead_line is not None:
-            try:
-                self.playhead_line.remove()
-            except (ValueError, AttributeError):
-                # Playhead line might already be removed or not in the axes
-                pass
-            
-        # Draw new playhead
-        self.playhead_line = self.ax.axvline(
-            self.playhead_position,
-            color=self.playhead_color,
-            linestyle='-',
-            linewidth=2,
-            alpha=0.9,
-            zorder=10
-        )
-    
+        """Create or move the playhead indicator line.
+
+        The line is animated (excluded from normal draws) and persists;
+        moving it is a set_xdata plus a blit, not an artist rebuild."""
+        if self.playhead_line is None:
+            self.playhead_line = self.ax.axvline(
+                self.playhead_position,
+                color=self.playhead_color,
+                linestyle='-',
+                linewidth=2,
+                alpha=0.9,
+                zorder=10,
+                animated=True
+            )
+        else:
+            self.playhead_line.set_xdata(
+                [self.playhead_position, self.playhead_position])
+            self.playhead_line.set_color(self.playhead_color)
+
     def update_playhead(self, position):
         """Update the playhead position and redraw"""
         # Store new position
         self.playhead_position = position
-        
+
         # Check if we need to scroll the view to follow the playhead
         view_width = self._xmax - self._xmin
         needs_scroll = (position < self._xmin or position > self._xmax)
-        
+
         # Auto-scroll if playhead moves outside visible area
         if needs_scroll:
             # Center the view on the playhead
@@ -362,13 +516,18 @@ class EnhancedWaveformCanvas(FigureCanvas):
             self._xmin = max(0, position - half_width)
             self._xmax = min(self.max_time, position + half_width)
             self.ax.set_xlim([self._xmin, self._xmax])
-            
+            self._plot_visible()
+
             # Emit signal that view changed
             self.zoomChanged.emit(self._xmin, self._xmax)
-        
-        # Redraw the playhead
-        self._draw_playhead()
-        self.draw()
+
+            self._draw_playhead()
+            self._full_draw()
+        else:
+            # Common per-tick path: restore the cached background and
+            # blit just the overlay
+            self._draw_playhead()
+            self._blit_overlay()
     
     def set_selection(self, start, end):
         """Set selection region in seconds"""
@@ -381,7 +540,7 @@ class EnhancedWaveformCanvas(FigureCanvas):
         
         self.selection = (start, end)
         self._draw_selection()
-        self.draw()
+        self._full_draw()
         
         # Emit selection changed signal
         self.selectionChanged.emit(start, end)
@@ -390,7 +549,7 @@ class EnhancedWaveformCanvas(FigureCanvas):
         """Clear the selection"""
         self.selection = None
         self._draw_selection()
-        self.draw()
+        self._full_draw()
         
     def zoom(self, factor=0.5, center=None):
         """
@@ -427,16 +586,17 @@ class EnhancedWaveformCanvas(FigureCanvas):
         # Update the view
         self._xmin, self._xmax = new_xmin, new_xmax
         self.ax.set_xlim([self._xmin, self._xmax])
-        
+        self._plot_visible()
+
         # Update grid based on new zoom level
         self._draw_time_grid()
         self._draw_selection()
         self._draw_playhead()
-        self.draw()
-        
+        self._full_draw()
+
         # Emit signal that view changed
         self.zoomChanged.emit(self._xmin, self._xmax)
-    
+
     def pan(self, offset):
         """
         Pan view by offset seconds.
@@ -462,10 +622,11 @@ class EnhancedWaveformCanvas(FigureCanvas):
         # Update the view
         self._xmin, self._xmax = new_xmin, new_xmax
         self.ax.set_xlim([self._xmin, self._xmax])
-        
+        self._plot_visible()
+
         # Update grid and redraw
         self._draw_time_grid()
-        self.draw()
+        self._full_draw()
         
         # Emit signal that view changed
         self.zoomChanged.emit(self._xmin, self._xmax)
@@ -485,7 +646,7 @@ class EnhancedWaveformCanvas(FigureCanvas):
                 # Shift+Click: Position playhead
                 self.playhead_position = time_pos
                 self._draw_playhead()
-                self.draw()
+                self._blit_overlay()
                 self.positionClicked.emit(time_pos)
                 return
                 
@@ -500,7 +661,7 @@ class EnhancedWaveformCanvas(FigureCanvas):
             self._last_scrub_pos = time_pos
             self.playhead_position = time_pos
             self._draw_playhead()
-            self.draw()
+            self._blit_overlay()
             self.positionClicked.emit(time_pos)
     
     def on_mouse_move(self, event):
@@ -515,13 +676,15 @@ class EnhancedWaveformCanvas(FigureCanvas):
             if event.xdata is not None:
                 self.playhead_position = max(0, min(event.xdata, self.max_time))
                 self._draw_playhead()
-                self.draw()
+                self._blit_overlay()
                 self.positionDragged.emit(self.playhead_position)
                 self._last_scrub_pos = event.xdata
         
-        # Update cursor info display
+        # Update cursor info display (coalesced through the timer)
         else:
-            self._update_cursor_info(event)
+            self._pending_cursor_event = event
+            if not self._cursor_timer.isActive():
+                self._cursor_timer.start()
     
     def on_mouse_release(self, event):
         """Handle mouse release events for selection and scrubbing"""
@@ -536,7 +699,7 @@ class EnhancedWaveformCanvas(FigureCanvas):
             if event.xdata is not None and event.inaxes == self.ax:
                 self.playhead_position = max(0, min(event.xdata, self.max_time))
                 self._draw_playhead()
-                self.draw()
+                self._blit_overlay()
                 self.positionDragged.emit(self.playhead_position)
             self._is_scrubbing = False
             self._last_scrub_pos = None
@@ -581,51 +744,67 @@ class EnhancedWaveformCanvas(FigureCanvas):
         elif event.key == 'escape':  # Escape = clear selection
             self.clear_selection()
     
+    def _flush_cursor(self):
+        """Draw the most recent hovered cursor position"""
+        event = self._pending_cursor_event
+        self._pending_cursor_event = None
+        if event is not None:
+            self._update_cursor_info(event)
+
     def _update_cursor_info(self, event):
         """Update cursor information display with time and amplitude"""
-        # Remove previous cursor markers
-        if self.live_cursor_line is not None:
-            try:
-                self.live_cursor_line.remove()
-            except (ValueError, AttributeError):
-                pass
-            self.live_cursor_line = None
-            
-        if self.live_cursor_text is not None:
-            try:
-                self.live_cursor_text.remove()
-            except (ValueError, AttributeError):
-                pass
-            self.live_cursor_text = None
-        
-        # Only proceed if cursor is in the plot area
+        # Outside the plot area: hide the overlay (if it was showing)
         if event.inaxes != self.ax or event.xdata is None:
-            self.draw()
+            if (self.live_cursor_line is not None
+                    and self.live_cursor_line.get_visible()):
+                self.live_cursor_line.set_visible(False)
+                self.live_cursor_text.set_visible(False)
+                self._blit_overlay()
             return
-            
+
         # Get time position
         t_cursor = event.xdata
-        
-        # Create vertical cursor line
-        self.live_cursor_line = self.ax.axvline(
-            t_cursor,
-            color="#ffe658",
-            alpha=0.45,
-            linewidth=1.2,
-            zorder=5
-        )
-        
-        # Display time and amplitude if we have audio data
-        if self.samples is not None and self.sr is not None and 0 <= t_cursor < self.max_time:
+
+        # The cursor line and label are persistent animated artists:
+        # per mouse event we only move them and blit the overlay
+        if self.live_cursor_line is None:
+            self.live_cursor_line = self.ax.axvline(
+                t_cursor,
+                color="#ffe658",
+                alpha=0.45,
+                linewidth=1.2,
+                zorder=5,
+                animated=True
+            )
+            self.live_cursor_text = self.ax.text(
+                t_cursor,
+                1,  # Top of y-axis
+                "",
+                va="bottom",
+                ha="left",
+                fontsize=9,
+                color="#ffee88",
+                bbox=dict(
+                    facecolor="#292a24",
+                    edgecolor="none",
+                    alpha=0.8,
+                    pad=1
+                ),
+                animated=True
+            )
+        else:
+            self.live_cursor_line.set_xdata([t_cursor, t_cursor])
+
+
+        # Display time and amplitude if we have audio data; the cached
+        # mono buffer is normalized float32, so the lookup is one index
+        if (self._samples_mono is not None and self.sr is not None
+                and 0 <= t_cursor < self.max_time):
             # Find the sample closest to cursor position
             sample_idx = int(t_cursor * self.sr)
-            if sample_idx < len(self.samples[0] if self.samples.ndim > 1 else self.samples):
-                # Extract amplitude value
-                if self.samples.ndim > 1:
-                    val = self.samples[0, sample_idx]
-                else:
-                    val = self.samples[sample_idx]
-                    
+            if 0 <= sample_idx < self._n_samples:
+                val = self._samples_mono[sample_idx]
+
                 # Format time and amplitude text
                 if t_cursor >= 60:
                     time_str = f"{int(t_cursor/60):d}:{int(t_cursor%60):02d}.{int((t_cursor*1000)%1000):03d}"
@@ -637,26 +816,14 @@ class EnhancedWaveformCanvas(FigureCanvas):
                 txt = f"{t_cursor:.3f}s"
         else:
             txt = f"{t_cursor:.3f}s"
-            
-        # Create text label with time/amplitude info
-        self.live_cursor_text = self.ax.text(
-            t_cursor,
-            1,  # Top of y-axis
-            txt,
-            va="bottom",
-            ha="left",
-            fontsize=9,
-            color="#ffee88",
-            bbox=dict(
-                facecolor="#292a24",
-                edgecolor="none",
-                alpha=0.8,
-                pad=1
-            )
-        )
-        
-        # Redraw to show the cursor info
-        self.draw()
+
+        self.live_cursor_text.set_position((t_cursor, 1))
+        self.live_cursor_text.set_text(txt)
+        self.live_cursor_line.set_visible(True)
+        self.live_cursor_text.set_visible(True)
+
+        # Blit just the overlay to show the cursor info
+        self._blit_overlay()
         
     def toggle_grid(self):
         """Toggle grid visibility"""
@@ -678,8 +845,8 @@ class EnhancedWaveformCanvas(FigureCanvas):
                 except (ValueError, AttributeError):
                     pass
             self.time_markers = []
-        
-        self.draw()
+
+        self._full_draw()
 
     def set_color_theme(self, waveform_color=None, playhead_color=None, grid_color=None, selection_color=None):
         """Update the color theme for the waveform display"""
@@ -692,6 +859,13 @@ class EnhancedWaveformCanvas(FigureCanvas):
         if selection_color:
             self.selection_color = selection_color
             
-        # Redraw with new colors (if we have data)
-        if self.samples is not None and self.sr is not None:
+        # Recolor the existing artists: no reason to recompute the mono
+        # mix and mip cascade just to change colors
+        if self._waveform_line is not None:
+            self._waveform_line.set_color(self.waveform_color)
+            self._draw_time_grid()
+            self._draw_selection()
+            self._draw_playhead()
+            self._full_draw()
+        elif self.samples is not None and self.sr is not None:
             self.plot_waveform(self.samples, self.sr)